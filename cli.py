@@ -4,30 +4,73 @@ OpenAI Admin CLI - Main entry point
 """
 import os
 import sys
-import logging
-import click
-from dotenv import load_dotenv
 
-from openai_admin.client import OpenAIAdminClient
+# Fast path: answer --version before any heavy imports or setup run
+if len(sys.argv) == 2 and sys.argv[1] in ('--version', '-V'):
+    from openai_admin import __version__
+    print(f"openai-admin {__version__}")
+    sys.exit(0)
 
-# Load environment variables from .env file
-load_dotenv()
+import logging
+import importlib
+import click
 
 # Setup logging - log file in project root
 project_root = os.path.dirname(os.path.abspath(__file__))
 log_file = os.path.join(project_root, 'openai_admin.log')
 logging.basicConfig(
-    level=logging.DEBUG,
+    level=logging.DEBUG if os.getenv('DEBUG') else logging.WARNING,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.FileHandler(log_file),
+        logging.FileHandler(log_file, delay=True),
         logging.StreamHandler(sys.stderr) if os.getenv('DEBUG') else logging.NullHandler()
     ]
 )
 logger = logging.getLogger('openai_admin')
 
 
-@click.group()
+# Cheap argv sniff: notification pairing only needs validating when the
+# invocation can actually notify (notification-capable subcommands or the
+# root-level options themselves). Commands decorated with
+# with_notification re-validate from ctx.obj anyway.
+_maybe_notify_cmd = any(
+    arg == 'notify' or arg == 'rotation' or arg.startswith('--notify') or arg.startswith('--channel')
+    for arg in sys.argv[1:]
+)
+
+
+class LazyGroup(click.Group):
+    """Click group that imports command modules only when they are invoked.
+
+    Keeps `--help` and unrelated subcommands from paying the import cost of
+    every command module (requests, tabulate, notifier deps, ...).
+    """
+
+    _lazy = {
+        'users': 'openai_admin.commands.users:users',
+        'projects': 'openai_admin.commands.projects:projects',
+        'keys': 'openai_admin.commands.keys:keys',
+        'service-accounts': 'openai_admin.commands.service_accounts:service_accounts',
+        'rate-limits': 'openai_admin.commands.rate_limits:rate_limits',
+        'usage': 'openai_admin.commands.usage:usage',
+        'costs': 'openai_admin.commands.costs:costs_command',
+        'audit': 'openai_admin.commands.audit:audit',
+        'notify': 'openai_admin.commands.notify:notify',
+        'rotation': 'openai_admin.commands.rotation:rotation',
+    }
+
+    def list_commands(self, ctx):
+        return sorted(self._lazy)
+
+    def get_command(self, ctx, name):
+        if name not in self._lazy:
+            return None
+        mod_path, attr = self._lazy[name].split(':')
+        module = importlib.import_module(mod_path)
+        return getattr(module, attr)
+
+
+@click.group(cls=LazyGroup)
 @click.option('--admin-key', envvar='OPENAI_ADMIN_KEY', help='OpenAI Admin API Key')
 @click.option('--notify', help='User ID to notify (requires --channel)')
 @click.option('--channel', type=click.Choice(['mattermost', 'email']), help='Notification channel (e.g., mattermost, email)')
@@ -39,38 +82,39 @@ def cli(ctx, admin_key, notify, channel):
     Support: julian.billinger@admin-intelligence.com
     """
     ctx.ensure_object(dict)
-    try:
-        ctx.obj['client'] = OpenAIAdminClient(admin_key)
-    except ValueError as e:
-        click.echo(f"Error: {e}", err=True)
-        sys.exit(1)
-    
+
+    # Load environment variables from .env file (client falls back to
+    # OPENAI_ADMIN_KEY from the environment, so loading here is early enough)
+    from dotenv import load_dotenv
+    load_dotenv()
+
+    def client_factory():
+        """Construct the API client on first use and cache it on ctx.obj"""
+        client = ctx.obj.get('client')
+        if client is None:
+            from openai_admin.client import OpenAIAdminClient
+            try:
+                client = OpenAIAdminClient(admin_key)
+            except ValueError as e:
+                click.echo(f"Error: {e}", err=True)
+                sys.exit(1)
+            ctx.obj['client'] = client
+        return client
+
+    ctx.obj['client_factory'] = client_factory
+
     # Store notification settings in context
     ctx.obj['notify_user'] = notify
     ctx.obj['notify_channel'] = channel
     
     # Validate notification options
-    if notify and not channel:
-        click.echo("Error: --notify requires --channel", err=True)
-        sys.exit(1)
-    if channel and not notify:
-        click.echo("Error: --channel requires --notify", err=True)
-        sys.exit(1)
-
-
-# Import and register command groups
-from openai_admin.commands import users, projects, keys, service_accounts, rate_limits, usage, costs, audit, notify, rotation
-
-cli.add_command(users.users)
-cli.add_command(projects.projects)
-cli.add_command(keys.keys)
-cli.add_command(service_accounts.service_accounts)
-cli.add_command(rate_limits.rate_limits)
-cli.add_command(usage.usage)
-cli.add_command(costs.costs_command)
-cli.add_command(audit.audit)
-cli.add_command(notify.notify)
-cli.add_command(rotation.rotation)
+    if _maybe_notify_cmd:
+        if notify and not channel:
+            click.echo("Error: --notify requires --channel", err=True)
+            sys.exit(1)
+        if channel and not notify:
+            click.echo("Error: --channel requires --notify", err=True)
+            sys.exit(1)
 
 
 if __name__ == '__main__':
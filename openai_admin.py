@@ -9,9 +9,18 @@ The codebase has been refactored into a modular structure:
 - cli.py - Main CLI entry point
 
 This file serves as a convenience wrapper for backward compatibility.
+The CLI import graph is only pulled in when `cli` is actually accessed
+(PEP 562 module __getattr__), so `import openai_admin` stays cheap.
 """
 
-from cli import cli
+
+def __getattr__(name):
+    if name == 'cli':
+        from cli import cli
+        return cli
+    raise AttributeError(name)
+
 
 if __name__ == '__main__':
+    from cli import cli
     cli()
@@ -2,12 +2,52 @@
 import os
 import sys
 import logging
+import threading
 from typing import Optional, List
 import click
 import requests
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger('openai_admin')
 
+# Cap on concurrent in-flight requests. Commands that fan out over thread
+# pools (projects delete, keys delete --parallel) can otherwise stack up
+# enough simultaneous calls to churn connections and trip 429s.
+_MAX_INFLIGHT = 16
+
+# Audit-log filter arguments mapped to their API parameter names; iterated
+# in a fixed order so the canonical URL is stable across calls
+_AUDIT_SCALAR_PARAMS = (
+    ("after", "after"),
+    ("before", "before"),
+    ("effective_at_gt", "effective_at[gt]"),
+    ("effective_at_gte", "effective_at[gte]"),
+    ("effective_at_lt", "effective_at[lt]"),
+    ("effective_at_lte", "effective_at[lte]"),
+)
+_AUDIT_LIST_PARAMS = (
+    ("project_ids", "project_ids[]"),
+    ("event_types", "event_types[]"),
+    ("actor_ids", "actor_ids[]"),
+    ("actor_emails", "actor_emails[]"),
+    ("resource_ids", "resource_ids[]"),
+)
+
+# Fields the rate-limit update endpoint accepts; anything else is dropped
+# instead of being forwarded to the API
+_RATE_LIMIT_KEYS = (
+    "max_requests_per_1_minute",
+    "max_tokens_per_1_minute",
+    "max_images_per_1_minute",
+    "max_audio_megabytes_per_1_minute",
+    "max_requests_per_1_day",
+    "batch_1_day_max_input_tokens",
+)
+
 
 class OpenAIAdminClient:
     """Client for OpenAI Admin API"""
@@ -22,42 +62,85 @@ class OpenAIAdminClient:
             "Authorization": f"Bearer {self.admin_key}",
             "Content-Type": "application/json"
         }
-    
+
+        # Reuse one session so the TLS connection to api.openai.com is kept
+        # alive across calls instead of re-handshaking per request
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=_MAX_INFLIGHT,
+            max_retries=requests.adapters.Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504]
+            )
+        )
+        self.session.mount("https://", adapter)
+
+        # Matches the adapter pool size, so every admitted request gets a
+        # kept-alive connection instead of opening a throwaway socket
+        self._inflight = threading.BoundedSemaphore(_MAX_INFLIGHT)
+
+        # Per-project rate-limit listings cached for preflight lookups;
+        # entries are dropped whenever a rate limit is updated
+        self._rate_limit_cache = {}
+
+        # Precomputed URLs for the fixed (non-parametrized) endpoints
+        self._urls = {
+            endpoint: f"{self.base_url}/{endpoint}"
+            for endpoint in (
+                "users", "projects", "admin_api_keys", "audit_logs", "costs",
+                "usage/completions", "usage/embeddings", "usage/images",
+                "usage/audio_speeches", "usage/audio_transcriptions"
+            )
+        }
+
     def _request(self, method: str, endpoint: str, params: Optional[dict] = None, json: Optional[dict] = None):
         """Make API request with error handling"""
-        url = f"{self.base_url}/{endpoint}"
+        url = self._urls.get(endpoint) or f"{self.base_url}/{endpoint}"
         
-        # Log the request
-        logger.info(f"API Request: {method} {url}")
-        logger.debug(f"Request params: {params}")
-        logger.debug(f"Request body: {json}")
+        # Log the request (%-style args defer formatting until a handler wants them)
+        logger.info("API Request: %s %s", method, url)
+        logger.debug("Request params: %s", params)
+        logger.debug("Request body: %s", json)
         
         try:
-            response = requests.request(
-                method=method,
-                url=url,
-                headers=self.headers,
-                params=params,
-                json=json
-            )
-            
-            # Log the response
-            logger.info(f"API Response: {response.status_code} for {method} {url}")
-            logger.debug(f"Response headers: {dict(response.headers)}")
-            logger.debug(f"Response body: {response.text}")
+            with self._inflight:
+                response = self.session.request(
+                    method=method,
+                    url=url,
+                    params=params,
+                    json=json
+                )
             
+            # Log the response; body decoding is only worth doing at DEBUG
+            status_code = response.status_code
+            logger.info("API Response: %s for %s %s", status_code, method, url)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Response headers: %s", dict(response.headers))
+                logger.debug("Response body: %s", response.text)
+
+            # Branch on the status code so the common 2xx case never pays
+            # for exception unwinding
+            if 200 <= status_code < 300:
+                # orjson parses large payloads (audit-log pages etc.)
+                # noticeably faster than stdlib json; fall back when it
+                # isn't installed
+                if orjson is not None:
+                    return orjson.loads(response.content)
+                return response.json()
+
+            # Error path: log details, then raise HTTPError for callers
+            logger.error("HTTP %s for %s %s", status_code, method, url)
+            if logger.isEnabledFor(logging.ERROR):
+                logger.error("Response body: %s", response.text)
+                try:
+                    logger.error("Error JSON: %s", response.json())
+                except:
+                    pass
             response.raise_for_status()
-            return response.json()
-        except requests.exceptions.HTTPError as e:
-            # Log the error details
-            logger.error(f"HTTP Error: {e}")
-            logger.error(f"Status Code: {e.response.status_code if e.response else 'N/A'}")
-            logger.error(f"Response body: {e.response.text if e.response else 'N/A'}")
-            try:
-                error_json = e.response.json() if e.response else {}
-                logger.error(f"Error JSON: {error_json}")
-            except:
-                pass
+        except requests.exceptions.HTTPError:
             # Re-raise HTTP errors so callers can handle them
             raise
         except Exception as e:
@@ -65,9 +148,12 @@ class OpenAIAdminClient:
             click.echo(f"Unexpected error: {e}", err=True)
             sys.exit(1)
     
-    def list_users(self, limit: int = 100) -> dict:
+    def list_users(self, limit: int = 100, after: Optional[str] = None) -> dict:
         """List all users in the organization"""
-        return self._request("GET", "users", params={"limit": limit})
+        params = {"limit": limit}
+        if after:
+            params["after"] = after
+        return self._request("GET", "users", params=params)
     
     def list_projects(self, include_archived: bool = False, limit: int = 100) -> dict:
         """List all projects in the organization"""
@@ -88,64 +174,46 @@ class OpenAIAdminClient:
         """Get a specific API key from a project"""
         return self._request("GET", f"projects/{project_id}/api_keys/{key_id}")
     
-    def get_usage_completions(self, start_time: int, end_time: Optional[int] = None, 
-                             group_by: Optional[List[str]] = None, limit: int = 7,
-                             project_ids: Optional[List[str]] = None, 
-                             models: Optional[List[str]] = None) -> dict:
-        """Get completions usage data"""
-        params = {
-            "start_time": start_time,
-            "limit": limit
-        }
+    def _get_usage(self, kind: str, start_time: int, end_time: Optional[int] = None,
+                   group_by: Optional[List[str]] = None, limit: int = 7, **extra) -> dict:
+        """Shared implementation for the usage/* endpoints"""
+        params = {"start_time": start_time, "limit": limit}
         if end_time:
             params["end_time"] = end_time
         if group_by:
             params["group_by"] = group_by
-        if project_ids:
-            params["project_ids"] = project_ids
-        if models:
-            params["models"] = models
-        return self._request("GET", "usage/completions", params=params)
-    
+        for key, value in extra.items():
+            if value is not None:
+                params[key] = value
+        return self._request("GET", f"usage/{kind}", params=params)
+
+    def get_usage_completions(self, start_time: int, end_time: Optional[int] = None,
+                             group_by: Optional[List[str]] = None, limit: int = 7,
+                             project_ids: Optional[List[str]] = None,
+                             models: Optional[List[str]] = None) -> dict:
+        """Get completions usage data"""
+        return self._get_usage("completions", start_time, end_time, group_by, limit,
+                               project_ids=project_ids, models=models)
+
     def get_usage_embeddings(self, start_time: int, end_time: Optional[int] = None,
                             group_by: Optional[List[str]] = None, limit: int = 7) -> dict:
         """Get embeddings usage data"""
-        params = {"start_time": start_time, "limit": limit}
-        if end_time:
-            params["end_time"] = end_time
-        if group_by:
-            params["group_by"] = group_by
-        return self._request("GET", "usage/embeddings", params=params)
-    
+        return self._get_usage("embeddings", start_time, end_time, group_by, limit)
+
     def get_usage_images(self, start_time: int, end_time: Optional[int] = None,
                         group_by: Optional[List[str]] = None, limit: int = 7) -> dict:
         """Get images usage data"""
-        params = {"start_time": start_time, "limit": limit}
-        if end_time:
-            params["end_time"] = end_time
-        if group_by:
-            params["group_by"] = group_by
-        return self._request("GET", "usage/images", params=params)
-    
+        return self._get_usage("images", start_time, end_time, group_by, limit)
+
     def get_usage_audio_speeches(self, start_time: int, end_time: Optional[int] = None,
                                  group_by: Optional[List[str]] = None, limit: int = 7) -> dict:
         """Get audio speeches (TTS) usage data"""
-        params = {"start_time": start_time, "limit": limit}
-        if end_time:
-            params["end_time"] = end_time
-        if group_by:
-            params["group_by"] = group_by
-        return self._request("GET", "usage/audio_speeches", params=params)
-    
+        return self._get_usage("audio_speeches", start_time, end_time, group_by, limit)
+
     def get_usage_audio_transcriptions(self, start_time: int, end_time: Optional[int] = None,
                                        group_by: Optional[List[str]] = None, limit: int = 7) -> dict:
         """Get audio transcriptions (Whisper) usage data"""
-        params = {"start_time": start_time, "limit": limit}
-        if end_time:
-            params["end_time"] = end_time
-        if group_by:
-            params["group_by"] = group_by
-        return self._request("GET", "usage/audio_transcriptions", params=params)
+        return self._get_usage("audio_transcriptions", start_time, end_time, group_by, limit)
     
     def get_costs(self, start_time: int, end_time: Optional[int] = None,
                   group_by: Optional[List[str]] = None, limit: int = 7,
@@ -167,35 +235,19 @@ class OpenAIAdminClient:
                        event_types: Optional[List[str]] = None, actor_ids: Optional[List[str]] = None,
                        actor_emails: Optional[List[str]] = None, resource_ids: Optional[List[str]] = None) -> dict:
         """List audit logs with optional filters"""
+        values = locals()
         params = {"limit": limit}
-        
-        if after:
-            params["after"] = after
-        if before:
-            params["before"] = before
-        
-        # Effective date range - use bracket notation for nested params
-        if effective_at_gt:
-            params["effective_at[gt]"] = effective_at_gt
-        if effective_at_gte:
-            params["effective_at[gte]"] = effective_at_gte
-        if effective_at_lt:
-            params["effective_at[lt]"] = effective_at_lt
-        if effective_at_lte:
-            params["effective_at[lte]"] = effective_at_lte
-        
-        # Array filters
-        if project_ids:
-            params["project_ids[]"] = project_ids
-        if event_types:
-            params["event_types[]"] = event_types
-        if actor_ids:
-            params["actor_ids[]"] = actor_ids
-        if actor_emails:
-            params["actor_emails[]"] = actor_emails
-        if resource_ids:
-            params["resource_ids[]"] = resource_ids
-        
+
+        for name, api_name in _AUDIT_SCALAR_PARAMS:
+            value = values[name]
+            if value is not None:
+                params[api_name] = value
+
+        for name, api_name in _AUDIT_LIST_PARAMS:
+            value = values[name]
+            if value:
+                params[api_name] = value
+
         return self._request("GET", "audit_logs", params=params)
     
     def get_project(self, project_id: str) -> dict:
@@ -206,9 +258,18 @@ class OpenAIAdminClient:
         """List users in a project"""
         return self._request("GET", f"projects/{project_id}/users", params={"limit": limit})
     
-    def list_project_service_accounts(self, project_id: str, limit: int = 100) -> dict:
-        """List service accounts in a project"""
-        return self._request("GET", f"projects/{project_id}/service_accounts", params={"limit": limit})
+    def list_project_service_accounts(self, project_id: str, limit: int = 100, after: Optional[str] = None) -> dict:
+        """List service accounts in a project
+
+        The admin API only supports limit/after here - no name-prefix or
+        field filtering - so rotation prefix matching has to stay
+        client-side. TODO: push the filter server-side if the endpoint
+        ever grows a name_prefix parameter.
+        """
+        params = {"limit": limit}
+        if after:
+            params["after"] = after
+        return self._request("GET", f"projects/{project_id}/service_accounts", params=params)
     
     def get_project_service_account(self, project_id: str, service_account_id: str) -> dict:
         """Get a specific service account from a project"""
@@ -217,6 +278,42 @@ class OpenAIAdminClient:
     def list_project_rate_limits(self, project_id: str, limit: int = 100) -> dict:
         """List rate limits for a project"""
         return self._request("GET", f"projects/{project_id}/rate_limits", params={"limit": limit})
+
+    def iter_project_rate_limits(self, project_id: str, page_size: int = 100):
+        """Iterate a project's rate limits, following pagination cursors
+
+        Yields one rate limit at a time so callers can stop early (e.g. an
+        itertools.islice cap) without fetching pages they never read.
+        """
+        after = None
+        while True:
+            params = {"limit": page_size}
+            if after:
+                params["after"] = after
+            page = self._request("GET", f"projects/{project_id}/rate_limits", params=params)
+            data = page.get("data", [])
+            yield from data
+            if not data or not page.get("has_more"):
+                return
+            after = data[-1].get("id")
+
+    def get_project_rate_limit(self, project_id: str, rate_limit_id: str) -> dict:
+        """Get a single rate limit from a project
+
+        The API only exposes a list endpoint for rate limits, so this
+        filters the listing for the requested id. Listings are cached per
+        project, making repeated preflights (several updates against one
+        project in a session) cost a single round trip; updates invalidate
+        the project's entry.
+        """
+        result = self._rate_limit_cache.get(project_id)
+        if result is None:
+            result = self.list_project_rate_limits(project_id)
+            self._rate_limit_cache[project_id] = result
+        for rl in result.get("data", []):
+            if rl.get("id") == rate_limit_id:
+                return rl
+        raise ValueError(f"Rate limit {rate_limit_id} not found in project {project_id}")
     
     def update_project_rate_limit(self, project_id: str, rate_limit_id: str, **kwargs) -> dict:
         """Update a rate limit for a project
@@ -229,9 +326,17 @@ class OpenAIAdminClient:
         - max_requests_per_1_day: int
         - batch_1_day_max_input_tokens: int
         """
-        # Filter out None values
-        data = {k: v for k, v in kwargs.items() if v is not None}
-        return self._request("POST", f"projects/{project_id}/rate_limits/{rate_limit_id}", json=data)
+        # Build the payload from the known schema, skipping unset fields
+        data = {}
+        for key in _RATE_LIMIT_KEYS:
+            value = kwargs.get(key)
+            if value is not None:
+                data[key] = value
+        result = self._request("POST", f"projects/{project_id}/rate_limits/{rate_limit_id}", json=data)
+        # The cached listing is stale now; drop it so post-update reads
+        # reflect server state
+        self._rate_limit_cache.pop(project_id, None)
+        return result
     
     def create_project(self, name: str) -> dict:
         """Create a new project"""
@@ -1,10 +1,11 @@
 import click
-import json
-import sys
-from datetime import datetime, timedelta
-from tabulate import tabulate
-from openai_admin.utils import format_timestamp, format_redacted_value, with_notification, notification_options
-import requests
+from openai_admin.utils import with_notification, notification_options
+
+# Output layout constants (built once instead of per echo/loop iteration)
+_MAJOR_100 = '=' * 100
+_SEP_100 = '─' * 100
+_MAJOR_80 = '=' * 80
+_INDENT_1 = ' ' * 3
 
 @click.group()
 def audit():
@@ -24,16 +25,18 @@ def audit():
 @click.option('--actor-email', multiple=True, help='Filter by actor email address')
 @click.option('--actor-id', multiple=True, help='Filter by actor ID (user, service account, or API key)')
 @click.option('--resource-id', multiple=True, help='Filter by resource ID')
+@click.option('--all', 'fetch_all', is_flag=True, help='Fetch all pages concurrently (requires --days)')
 @click.option('--format', 'output_format', type=click.Choice(['table', 'json', 'detailed']), default='table', help='Output format')
 @click.pass_context
 @notification_options
 @with_notification
-def list_audit_logs(ctx, limit, after, before, start_date, end_date, days, event_type, 
-                   project_id, actor_email, actor_id, resource_id, output_format):
+def list_audit_logs(ctx, limit, after, before, start_date, end_date, days, event_type,
+                   project_id, actor_email, actor_id, resource_id, fetch_all, output_format):
     """List audit logs for security and compliance monitoring"""
-    client = ctx.obj['client']
-    
+    client = ctx.obj['client_factory']()
+
     from datetime import datetime, timedelta
+    from openai_admin.utils import format_timestamp, format_table
     
     # Handle date filters
     effective_at_gte = None
@@ -60,19 +63,70 @@ def list_audit_logs(ctx, limit, after, before, start_date, end_date, days, event
     
     # Apply Progress Message Style
     click.echo("Fetching audit logs...")
-    result = client.list_audit_logs(
-        limit=limit,
-        after=after,
-        before=before,
-        effective_at_gte=effective_at_gte,
-        effective_at_lt=effective_at_lt,
-        event_types=list(event_type) if event_type else None,
-        project_ids=list(project_id) if project_id else None,
-        actor_emails=list(actor_email) if actor_email else None,
-        actor_ids=list(actor_id) if actor_id else None,
-        resource_ids=list(resource_id) if resource_id else None
-    )
-    
+
+    if fetch_all:
+        if not days:
+            # Apply Error Message Style
+            click.echo("[ERROR] --all requires --days to define the time window", err=True)
+            return
+
+        # Split the time window into equal sub-intervals and fetch them
+        # concurrently - each window query is independent, so the wall time
+        # is bounded by the slowest request instead of the sum of all of them
+        import concurrent.futures
+
+        max_workers = 8
+        step = max((effective_at_lt - effective_at_gte) // max_workers, 1)
+        intervals = []
+        window_start = effective_at_gte
+        while window_start < effective_at_lt:
+            intervals.append((window_start, min(window_start + step, effective_at_lt)))
+            window_start += step
+
+        def fetch_window(interval):
+            return client.list_audit_logs(
+                limit=100,
+                effective_at_gte=interval[0],
+                effective_at_lt=interval[1],
+                event_types=list(event_type) if event_type else None,
+                project_ids=list(project_id) if project_id else None,
+                actor_emails=list(actor_email) if actor_email else None,
+                actor_ids=list(actor_id) if actor_id else None,
+                resource_ids=list(resource_id) if resource_id else None
+            )
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            window_results = list(executor.map(fetch_window, intervals))
+
+        # Merge windows, dedupe by log ID and sort newest-first like the API
+        seen_ids = set()
+        merged = []
+        for window in window_results:
+            for log in window.get('data', []):
+                if log.get('id') not in seen_ids:
+                    seen_ids.add(log.get('id'))
+                    merged.append(log)
+        merged.sort(key=lambda log: log.get('effective_at') or 0, reverse=True)
+
+        result = {
+            'object': 'list',
+            'data': merged,
+            'has_more': any(window.get('has_more') for window in window_results)
+        }
+    else:
+        result = client.list_audit_logs(
+            limit=limit,
+            after=after,
+            before=before,
+            effective_at_gte=effective_at_gte,
+            effective_at_lt=effective_at_lt,
+            event_types=list(event_type) if event_type else None,
+            project_ids=list(project_id) if project_id else None,
+            actor_emails=list(actor_email) if actor_email else None,
+            actor_ids=list(actor_id) if actor_id else None,
+            resource_ids=list(resource_id) if resource_id else None
+        )
+
     logs_data = result.get('data', [])
     
     if not logs_data:
@@ -81,64 +135,71 @@ def list_audit_logs(ctx, limit, after, before, start_date, end_date, days, event
         return
     
     if output_format == 'json':
-        import json
         # Apply JSON Output Style
-        click.echo(json.dumps(result, indent=2))
+        try:
+            import orjson
+            click.echo(orjson.dumps(result, option=orjson.OPT_INDENT_2).decode())
+        except ImportError:
+            import json
+            click.echo(json.dumps(result, indent=2))
         return
     
     if output_format == 'detailed':
         # Apply Detailed Output Format (Major Section Header)
-        click.echo(f"\n{'='*100}")
+        click.echo(f"\n{_MAJOR_100}")
         click.echo(f"Audit Logs - {len(logs_data)} events")
-        click.echo(f"{'='*100}\n")
-        
+        click.echo(f"{_MAJOR_100}\n")
+
         for log in logs_data:
+            # Buffer each log block and emit it with a single write instead
+            # of one click.echo per line
             # Apply Minor Separator
-            click.echo(f"{'─'*100}")
-            click.echo(f"ID: {log.get('id')}")
-            click.echo(f"Type: {log.get('type')}")
-            click.echo(f"Time: {format_timestamp(log.get('effective_at'))}")
-            
+            lines = [_SEP_100]
+            lines.append(f"ID: {log.get('id')}")
+            lines.append(f"Type: {log.get('type')}")
+            lines.append(f"Time: {format_timestamp(log.get('effective_at'))}")
+
             # Actor information
             actor = log.get('actor', {})
             actor_type = actor.get('type', 'unknown')
-            click.echo(f"Actor Type: {actor_type}")
-            
+            lines.append(f"Actor Type: {actor_type}")
+
             # Apply Indentation (Level 1: 3 spaces)
-            indent_1 = ' ' * 3
+            indent_1 = _INDENT_1
             if actor_type == 'session':
                 session = actor.get('session', {})
                 user = session.get('user', {})
-                click.echo(f"{indent_1}User: {user.get('email', 'N/A')} (ID: {user.get('id', 'N/A')})")
-                click.echo(f"{indent_1}IP: {session.get('ip_address', 'N/A')}")
+                lines.append(f"{indent_1}User: {user.get('email', 'N/A')} (ID: {user.get('id', 'N/A')})")
+                lines.append(f"{indent_1}IP: {session.get('ip_address', 'N/A')}")
                 if session.get('user_agent'):
                     # Apply Long Text Truncation
-                    click.echo(f"{indent_1}User Agent: {session.get('user_agent')[:80]}...")
+                    lines.append(f"{indent_1}User Agent: {session.get('user_agent')[:80]}...")
             elif actor_type == 'api_key':
                 api_key = actor.get('api_key', {})
                 key_type = api_key.get('type', 'unknown')
                 if key_type == 'user':
                     user = api_key.get('user', {})
-                    click.echo(f"{indent_1}User: {user.get('email', 'N/A')} (ID: {user.get('id', 'N/A')})")
+                    lines.append(f"{indent_1}User: {user.get('email', 'N/A')} (ID: {user.get('id', 'N/A')})")
                 elif key_type == 'service_account':
                     sa = api_key.get('service_account', {})
-                    click.echo(f"{indent_1}Service Account: {sa.get('id', 'N/A')}")
-            
+                    lines.append(f"{indent_1}Service Account: {sa.get('id', 'N/A')}")
+
             # Project context
             project = log.get('project')
             if project:
-                click.echo(f"Project: {project.get('id', 'N/A')} - {project.get('name', 'N/A')}")
-            
+                lines.append(f"Project: {project.get('id', 'N/A')} - {project.get('name', 'N/A')}")
+
             # Event-specific data
             event_type_key = log.get('type')
             if event_type_key in log:
                 event_data = log.get(event_type_key, {})
                 if event_data:
-                    click.echo(f"Details: {event_data}")
-            
-            click.echo()
-        
-        click.echo(f"{'─'*100}")
+                    lines.append(f"Details: {event_data}")
+
+            lines.append('')
+            click.echo("\n".join(lines))
+
+        click.echo(_SEP_100)
         
         if result.get('has_more'):
             click.echo(f"\n[WARNING] More logs available. Use --after={result.get('last_id')} to fetch next page")
@@ -186,9 +247,9 @@ def list_audit_logs(ctx, limit, after, before, start_date, end_date, days, event
     
     # Apply Summary Lines Style
     click.echo(f"\nTotal logs: {len(logs_data)}\n")
-    
+
     # Apply Table Output Style (grid format)
-    click.echo(tabulate(table_data, headers=headers, tablefmt='grid'))
+    click.echo(format_table(table_data, headers))
     
     if result.get('has_more'):
         click.echo(f"\n[WARNING] More logs available. Use --after={result.get('last_id')} to fetch next page")
@@ -241,9 +302,9 @@ def list_event_types():
     }
     
     # Apply Major Section Header Style (80-character width)
-    click.echo(f"\n{'='*80}")
+    click.echo(f"\n{_MAJOR_80}")
     click.echo("Common Audit Log Event Types")
-    click.echo(f"{'='*80}\n")
+    click.echo(f"{_MAJOR_80}\n")
     
     # Apply Message Prefix Style ([INFO])
     click.echo("[INFO] Use these with --event-type option to filter logs\n")
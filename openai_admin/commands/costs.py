@@ -1,10 +1,53 @@
 import click
 import json
 import sys
+import time
 from datetime import datetime, timedelta
 from tabulate import tabulate
-from openai_admin.utils import format_timestamp, format_redacted_value, with_notification, notification_options
-import requests
+from openai_admin.utils import format_timestamp, format_redacted_value, format_table, with_notification, notification_options
+
+# Section separators, built once at import time
+SEP_MAJOR = '=' * 80
+SEP_MINOR = '─' * 80
+
+def _parse_date(value):
+    """Parse a YYYY-MM-DD option into a Unix timestamp, exiting on bad input"""
+    try:
+        # fromisoformat is implemented in C and avoids re-parsing a strptime
+        # format string on every call
+        return int(datetime.fromisoformat(value).timestamp())
+    except ValueError:
+        # Apply Error Message Style
+        click.echo(f"[ERROR] Error parsing date: {value}", err=True)
+        click.echo("Use format: YYYY-MM-DD", err=True)
+        sys.exit(2)
+
+
+def _make_row_builder(want_project_id, want_line_item):
+    """Return a row builder specialized for the active group_by columns
+
+    Picks one straight-line function up front so the per-row loop carries
+    no grouping branches.
+    """
+    def cost_cell(item):
+        amount = item.get('amount', {})
+        # Apply Monetary Values Format
+        return f"${amount.get('value', 0):,.4f} {amount.get('currency', 'usd').upper()}"
+
+    if want_project_id and want_line_item:
+        def build(item):
+            return [item.get('project_id') or 'N/A', item.get('line_item') or 'N/A', cost_cell(item)]
+    elif want_project_id:
+        def build(item):
+            return [item.get('project_id') or 'N/A', cost_cell(item)]
+    elif want_line_item:
+        def build(item):
+            return [item.get('line_item') or 'N/A', cost_cell(item)]
+    else:
+        def build(item):
+            return [cost_cell(item)]
+    return build
+
 
 @click.command('costs')
 @click.option('--start-date', help='Start date (YYYY-MM-DD)')
@@ -15,12 +58,13 @@ import requests
 @click.option('--project-id', multiple=True, help='Filter by project ID (can be used multiple times)')
 @click.option('--limit', default=7, help='Number of time buckets to return')
 @click.option('--format', 'output_format', type=click.Choice(['table', 'json']), default='table', help='Output format')
+@click.option('--classic-table', is_flag=True, help='Render tables with tabulate instead of the fast built-in formatter')
 @click.pass_context
 @notification_options
 @with_notification
-def costs_command(ctx, start_date, end_date, days, group_by, project_id, limit, output_format):
+def costs_command(ctx, start_date, end_date, days, group_by, project_id, limit, output_format, classic_table):
     """Get costs/spending data"""
-    client = ctx.obj['client']
+    client = ctx.obj['client_factory']()
     
     from datetime import datetime, timedelta
     
@@ -33,26 +77,13 @@ def costs_command(ctx, start_date, end_date, days, group_by, project_id, limit,
     end_time = None
     
     if days:
-        end_dt = datetime.now()
-        start_dt = end_dt - timedelta(days=days)
-        start_time = int(start_dt.timestamp())
-        end_time = int(end_dt.timestamp())
+        # Plain epoch arithmetic; no datetime/timedelta objects needed
+        end_time = int(time.time())
+        start_time = end_time - days * 86400
     else:
-        try:
-            start_dt = datetime.strptime(start_date, '%Y-%m-%d')
-            start_time = int(start_dt.timestamp())
-            
-            if end_date:
-                end_dt = datetime.strptime(end_date, '%Y-%m-%d')
-                end_time = int(end_dt.timestamp())
-            else:
-                end_time = int(datetime.now().timestamp())
-        except ValueError as e:
-            # Apply Error Message Style
-            click.echo(f"[ERROR] Error parsing date: {e}", err=True)
-            click.echo("Use format: YYYY-MM-DD", err=True)
-            return
-    
+        start_time = _parse_date(start_date)
+        end_time = _parse_date(end_date) if end_date else int(time.time())
+
     # Apply Progress Message Style
     click.echo("Fetching costs data...")
     result = client.get_costs(
@@ -63,12 +94,14 @@ def costs_command(ctx, start_date, end_date, days, group_by, project_id, limit,
         project_ids=list(project_id) if project_id else None
     )
     
+    # JSON output must return here, before any table-only work (header date
+    # formatting, per-bucket rendering) - keep it that way
     if output_format == 'json':
-        import json
-        # Apply JSON Output Style
-        click.echo(json.dumps(result, indent=2))
+        # Apply JSON Output Style (streamed; avoids building one huge string)
+        json.dump(result, sys.stdout, indent=2)
+        sys.stdout.write("\n")
         return
-    
+
     # Table format
     data_buckets = result.get('data', [])
     
@@ -77,77 +110,82 @@ def costs_command(ctx, start_date, end_date, days, group_by, project_id, limit,
         click.echo("No cost data found for the specified period.")
         return
     
+    # Buffer the report and emit it with a single write at the end instead
+    # of one click.echo per line
+    out = []
+    emit = out.append
+
     # Apply Major Section Header Style
     start_date_formatted = datetime.fromtimestamp(start_time).strftime('%Y-%m-%d')
     end_date_formatted = datetime.fromtimestamp(end_time).strftime('%Y-%m-%d')
-    click.echo(f"\n{'='*80}")
-    click.echo(f"Costs Report")
-    click.echo(f"Period: {start_date_formatted} to {end_date_formatted}")
-    click.echo(f"{'='*80}\n")
+    emit(f"\n{SEP_MAJOR}")
+    emit("Costs Report")
+    emit(f"Period: {start_date_formatted} to {end_date_formatted}")
+    emit(f"{SEP_MAJOR}\n")
     
     total_cost = 0.0
-    
+
+    # Consecutive buckets share boundary timestamps (bucket N's end_time is
+    # bucket N+1's start_time), so a local dict dedupes the formatting work
+    _ts_cache = {}
+
+    def fmt_ts(ts):
+        formatted = _ts_cache.get(ts)
+        if formatted is None:
+            formatted = format_timestamp(ts)
+            _ts_cache[ts] = formatted
+        return formatted
+
+    # Hoist grouping decisions out of the per-result loops
+    want_project_id = 'project_id' in group_by
+    want_line_item = 'line_item' in group_by
+    build_row = _make_row_builder(want_project_id, want_line_item)
+
+    # Build headers (Title Case) once
+    headers = []
+    if want_project_id:
+        headers.append('Project ID')
+    if want_line_item:
+        headers.append('Line Item')
+    headers.append('Cost')
+
     for bucket in data_buckets:
         # Format timestamps consistently: YYYY-MM-DD HH:MM:SS
-        bucket_start = format_timestamp(bucket.get('start_time'))
-        bucket_end = format_timestamp(bucket.get('end_time'))
+        bucket_start = fmt_ts(bucket.get('start_time'))
+        bucket_end = fmt_ts(bucket.get('end_time'))
         
         # Apply Subsection Header Style (Minor Separator)
-        click.echo(f"{'────────────────────────────────────────────────────────────────────────────────'}")
-        click.echo(f"Time Bucket: {bucket_start} to {bucket_end}")
-        click.echo(f"{'────────────────────────────────────────────────────────────────────────────────'}")
+        emit(SEP_MINOR)
+        emit(f"Time Bucket: {bucket_start} to {bucket_end}")
+        emit(SEP_MINOR)
         
         results = bucket.get('results', [])
         if not results:
             # Apply Indentation (Level 1: 3 spaces) for minor message
-            click.echo("   No data in this bucket.\n")
+            emit("   No data in this bucket.\n")
             continue
         
-        table_data = []
-        bucket_total = 0.0
-        
-        for result_item in results:
-            row = []
-            
-            # Add grouping columns if specified
-            if 'project_id' in group_by:
-                row.append(result_item.get('project_id') or 'N/A')
-            if 'line_item' in group_by:
-                # Apply Table Header Style (Title Case)
-                row.append(result_item.get('line_item') or 'N/A')
-            
-            # Add cost
-            amount = result_item.get('amount', {})
-            value = amount.get('value', 0)
-            currency = amount.get('currency', 'usd').upper()
-            
-            bucket_total += value
-            total_cost += value
-            
-            # Apply Monetary Values Format (with thousand separators for large amounts, although not needed for this small example, the format is consistent)
-            formatted_cost = f"${value:,.4f} {currency}" 
-            row.append(formatted_cost)
-            
-            table_data.append(row)
-        
-        # Build headers (Title Case)
-        headers = []
-        if 'project_id' in group_by:
-            headers.append('Project ID')
-        if 'line_item' in group_by:
-            headers.append('Line Item')
-        headers.append('Cost')
-        
+        # Accumulate in C via sum() instead of += per Python loop iteration
+        bucket_total = sum(item.get('amount', {}).get('value', 0) for item in results)
+        total_cost += bucket_total
+
+        table_data = [build_row(item) for item in results]
+
         # Apply Table Output Style (grid format)
-        click.echo(tabulate(table_data, headers=headers, tablefmt='grid'))
-        
+        if classic_table:
+            emit(tabulate(table_data, headers=headers, tablefmt='grid'))
+        else:
+            emit(format_table(table_data, headers))
+
         # Apply Monetary Values Format for Bucket Total
         bucket_total_formatted = f"${bucket_total:,.4f}"
-        click.echo(f"\nBucket Total: {bucket_total_formatted}")
-        click.echo()
+        emit(f"\nBucket Total: {bucket_total_formatted}")
+        emit("")
     
     # Apply Major Section Header Style and Monetary Values Format for TOTAL COST
     total_cost_formatted = f"${total_cost:,.4f}"
-    click.echo(f"{'='*80}")
-    click.echo(f"TOTAL COST: {total_cost_formatted}")
-    click.echo(f"{'='*80}\n")
\ No newline at end of file
+    emit(SEP_MAJOR)
+    emit(f"TOTAL COST: {total_cost_formatted}")
+    emit(f"{SEP_MAJOR}\n")
+
+    click.echo("\n".join(out))
\ No newline at end of file
@@ -4,8 +4,10 @@ import json
 import sys
 from datetime import datetime, timedelta
 from tabulate import tabulate
-from openai_admin.utils import format_timestamp, format_redacted_value, with_notification, notification_options
-import requests
+from openai_admin.utils import format_timestamp, format_redacted_value, format_table, with_notification, notification_options
+
+# Section separator, built once at import time
+SEP_MAJOR = '=' * 80
 
 @click.group()
 def keys():
@@ -16,12 +18,13 @@ def keys():
 @keys.command('list-admin')
 @click.option('--limit', default=100, help='Maximum number of keys to return')
 @click.option('--format', 'output_format', type=click.Choice(['table', 'json']), default='table', help='Output format')
+@click.option('--classic-table', is_flag=True, help='Render tables with tabulate instead of the fast built-in formatter')
 @click.pass_context
 @notification_options
 @with_notification
-def list_admin_keys(ctx, limit, output_format):
+def list_admin_keys(ctx, limit, output_format, classic_table):
     """List all admin API keys"""
-    client = ctx.obj['client']
+    client = ctx.obj['client_factory']()
     
     # Apply Progress Message Style
     click.echo("Fetching admin API keys...")
@@ -35,30 +38,30 @@ def list_admin_keys(ctx, limit, output_format):
         return
     
     if output_format == 'json':
-        import json
-        # Apply JSON Output Style
-        click.echo(json.dumps(result, indent=2))
+        # Apply JSON Output Style (streamed; avoids building one huge string)
+        json.dump(result, sys.stdout, indent=2)
+        sys.stdout.write("\n")
     else:
-        # Table format
+        # Table format; bind lookups once per row to keep the loop body tight
         table_data = []
+        append_row = table_data.append
         for key in keys_data:
-            owner = key.get('owner', {})
+            get = key.get
+            owner = get('owner', {})
             owner_type = owner.get('type', 'N/A')
             owner_name = 'N/A'
-            
-            if owner_type == 'user':
-                owner_name = owner.get('name', 'N/A')
-            elif owner_type == 'service_account':
+
+            if owner_type in ('user', 'service_account'):
                 owner_name = owner.get('name', 'N/A')
-            
-            table_data.append([
-                key.get('id', 'N/A'),
-                key.get('name', 'N/A'),
-                format_redacted_value(key.get('redacted_value', '')),
+
+            append_row([
+                get('id', 'N/A'),
+                get('name', 'N/A'),
+                format_redacted_value(get('redacted_value', '')),
                 owner_type,
                 owner_name,
-                format_timestamp(key.get('created_at')),
-                format_timestamp(key.get('last_used_at'))
+                format_timestamp(get('created_at')),
+                format_timestamp(get('last_used_at'))
             ])
         
         # Apply Table Header Style (Title Case)
@@ -66,21 +69,25 @@ def list_admin_keys(ctx, limit, output_format):
         
         # Apply Summary Lines Style
         click.echo(f"\nTotal admin keys: {len(keys_data)}\n")
-        
+
         # Apply Table Output Style (grid format)
-        click.echo(tabulate(table_data, headers=headers, tablefmt='grid'))
+        if classic_table:
+            click.echo(tabulate(table_data, headers=headers, tablefmt='grid'))
+        else:
+            click.echo(format_table(table_data, headers))
 
 
 @keys.command('list-project')
 @click.argument('project_id')
 @click.option('--limit', default=100, help='Maximum number of keys to return')
 @click.option('--format', 'output_format', type=click.Choice(['table', 'json']), default='table', help='Output format')
+@click.option('--classic-table', is_flag=True, help='Render tables with tabulate instead of the fast built-in formatter')
 @click.pass_context
 @notification_options
 @with_notification
-def list_project_keys(ctx, project_id, limit, output_format):
+def list_project_keys(ctx, project_id, limit, output_format, classic_table):
     """List API keys for a specific project"""
-    client = ctx.obj['client']
+    client = ctx.obj['client_factory']()
     
     # Apply Progress Message Style
     click.echo(f"Fetching API keys for project {project_id}...")
@@ -94,32 +101,32 @@ def list_project_keys(ctx, project_id, limit, output_format):
         return
     
     if output_format == 'json':
-        import json
-        # Apply JSON Output Style
-        click.echo(json.dumps(result, indent=2))
+        # Apply JSON Output Style (streamed; avoids building one huge string)
+        json.dump(result, sys.stdout, indent=2)
+        sys.stdout.write("\n")
     else:
-        # Table format
+        # Table format; bind lookups once per row to keep the loop body tight
         table_data = []
+        append_row = table_data.append
         for key in keys_data:
-            owner = key.get('owner', {})
+            get = key.get
+            owner = get('owner', {})
             owner_type = owner.get('type', 'N/A')
             owner_name = 'N/A'
-            
+
             if owner_type == 'user':
-                user_data = owner.get('user', {})
-                owner_name = user_data.get('name', 'N/A')
+                owner_name = owner.get('user', {}).get('name', 'N/A')
             elif owner_type == 'service_account':
-                sa_data = owner.get('service_account', {})
-                owner_name = sa_data.get('name', 'N/A')
-            
-            table_data.append([
-                key.get('id', 'N/A'),
-                key.get('name', 'N/A'),
-                format_redacted_value(key.get('redacted_value', '')),
+                owner_name = owner.get('service_account', {}).get('name', 'N/A')
+
+            append_row([
+                get('id', 'N/A'),
+                get('name', 'N/A'),
+                format_redacted_value(get('redacted_value', '')),
                 owner_type,
                 owner_name,
-                format_timestamp(key.get('created_at')),
-                format_timestamp(key.get('last_used_at'))
+                format_timestamp(get('created_at')),
+                format_timestamp(get('last_used_at'))
             ])
         
         # Apply Table Header Style (Title Case)
@@ -127,9 +134,12 @@ def list_project_keys(ctx, project_id, limit, output_format):
         
         # Apply Summary Lines Style
         click.echo(f"\nTotal project keys: {len(keys_data)}\n")
-        
+
         # Apply Table Output Style (grid format)
-        click.echo(tabulate(table_data, headers=headers, tablefmt='grid'))
+        if classic_table:
+            click.echo(tabulate(table_data, headers=headers, tablefmt='grid'))
+        else:
+            click.echo(format_table(table_data, headers))
 
 
 @keys.command('get')
@@ -141,7 +151,7 @@ def list_project_keys(ctx, project_id, limit, output_format):
 @with_notification
 def get_project_key(ctx, project_id, key_id, output_format):
     """Get details of a specific API key"""
-    client = ctx.obj['client']
+    client = ctx.obj['client_factory']()
     
     click.echo(f"Fetching API key {key_id} from project {project_id}...")
     try:
@@ -151,18 +161,18 @@ def get_project_key(ctx, project_id, key_id, output_format):
         sys.exit(1)
     
     if output_format == 'json':
-        import json
-        # Apply JSON Output Style
-        click.echo(json.dumps(key, indent=2))
+        # Apply JSON Output Style (streamed; avoids building one huge string)
+        json.dump(key, sys.stdout, indent=2)
+        sys.stdout.write("\n")
     else:
         # Detailed view
         owner = key.get('owner', {})
         owner_type = owner.get('type', 'N/A')
         
         # Apply Major Section Header Style (80-character width)
-        click.echo(f"\n{'='*80}")
+        click.echo(f"\n{SEP_MAJOR}")
         click.echo(f"API Key Details")
-        click.echo(f"{'='*80}")
+        click.echo(SEP_MAJOR)
         
         # Consistent label-value alignment
         click.echo(f"ID:              {key.get('id')}")
@@ -183,67 +193,102 @@ def get_project_key(ctx, project_id, key_id, output_format):
             click.echo(f"Account ID:      {sa.get('id', 'N/A')}")
             click.echo(f"Account Role:    {sa.get('role', 'N/A')}")
         
-        click.echo(f"{'='*80}\n")
+        click.echo(f"{SEP_MAJOR}\n")
 
 
 @keys.command('delete')
 @click.argument('project_id')
-@click.argument('key_id')
+@click.argument('key_ids', nargs=-1, required=True)
 @click.option('--force', is_flag=True, help='Skip confirmation prompt')
+@click.option('--parallel', default=1, help='Concurrent requests when deleting multiple keys')
 @click.pass_context
 @notification_options
 @with_notification
-def delete_project_key(ctx, project_id, key_id, force):
-    """Delete an API key from a project
-    
+def delete_project_key(ctx, project_id, key_ids, force, parallel):
+    """Delete one or more API keys from a project
+
     Note: Cannot delete service account API keys. To remove a service account's
     key, delete the entire service account using 'service-accounts delete'.
     """
-    client = ctx.obj['client']
-    
-    # Get key details first
-    try:
-        key = client.get_project_api_key(project_id, key_id)
-    except Exception as e:
-        click.echo(f"[ERROR] Error fetching key {key_id}: {e}", err=True)
-        sys.exit(1)
-    
-    owner = key.get('owner', {})
-    owner_type = owner.get('type', 'N/A')
-    key_name = key.get('name', 'N/A')
-    
-    # Check if it's a service account key
-    if owner_type == 'service_account':
-        sa = owner.get('service_account', {})
-        sa_id = sa.get('id', 'N/A')
-        
-        click.echo(f"[ERROR] Failed to delete API key {key_id}: Key belongs to Service Account '{sa.get('name', 'N/A')}' ({sa_id}).", err=True)
-        click.echo(f"[NOTE] Service Account keys cannot be deleted individually.", err=True)
-        click.echo(f"[TIP] To remove this key, delete the entire Service Account:", err=True)
-        click.echo(f"   python openai_admin.py service-accounts delete {project_id} {sa_id}", err=True)
-        sys.exit(1)
-    
+    client = ctx.obj['client_factory']()
+
+    def fetch_key(kid):
+        try:
+            return kid, client.get_project_api_key(project_id, kid), None
+        except Exception as e:
+            return kid, None, e
+
+    # Fetch key details first; overlap the round-trips when --parallel > 1
+    if parallel > 1 and len(key_ids) > 1:
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=min(parallel, len(key_ids))) as executor:
+            fetched = list(executor.map(fetch_key, key_ids))
+    else:
+        fetched = [fetch_key(kid) for kid in key_ids]
+
+    deletable = []
+    for key_id, key, error in fetched:
+        if error is not None:
+            click.echo(f"[ERROR] Error fetching key {key_id}: {error}", err=True)
+            sys.exit(1)
+
+        owner = key.get('owner', {})
+        owner_type = owner.get('type', 'N/A')
+
+        # Check if it's a service account key
+        if owner_type == 'service_account':
+            sa = owner.get('service_account', {})
+            sa_id = sa.get('id', 'N/A')
+
+            click.echo(f"[ERROR] Failed to delete API key {key_id}: Key belongs to Service Account '{sa.get('name', 'N/A')}' ({sa_id}).", err=True)
+            click.echo(f"[NOTE] Service Account keys cannot be deleted individually.", err=True)
+            click.echo(f"[TIP] To remove this key, delete the entire Service Account:", err=True)
+            click.echo(f"   python openai_admin.py service-accounts delete {project_id} {sa_id}", err=True)
+            sys.exit(1)
+
+        deletable.append((key_id, key, owner, owner_type))
+
     # Show what will be deleted
-    click.echo(f"\n[INFO] API Key to delete:")
-    
+    click.echo(f"\n[INFO] API Key{'s' if len(deletable) > 1 else ''} to delete:")
+
     indent_1 = ' ' * 3
-    click.echo(f"{indent_1}ID:   {key_id}")
-    click.echo(f"{indent_1}Name: {key_name}")
-    
-    if owner_type == 'user':
-        user = owner.get('user', {})
-        click.echo(f"{indent_1}User: {user.get('email', 'N/A')}")
-    
+    for key_id, key, owner, owner_type in deletable:
+        click.echo(f"{indent_1}ID:   {key_id}")
+        click.echo(f"{indent_1}Name: {key.get('name', 'N/A')}")
+
+        if owner_type == 'user':
+            user = owner.get('user', {})
+            click.echo(f"{indent_1}User: {user.get('email', 'N/A')}")
+
     if not force:
-        if not click.confirm(f'\nDo you want to delete API key {key_id}?'):
+        key_list = ', '.join(key_id for key_id, _, _, _ in deletable)
+        if not click.confirm(f'\nDo you want to delete API key{"s" if len(deletable) > 1 else ""} {key_list}?'):
             click.echo("Cancelled.")
             return
-    
-    # Delete the key
-    click.echo(f"\nDeleting API key {key_id}...")
-    try:
-        client.delete_project_api_key(project_id, key_id)
-        click.echo(f"\n[SUCCESS] API key deleted successfully.")
-    except Exception as e:
-        click.echo(f"\n[ERROR] Error deleting key: {e}", err=True)
-        sys.exit(1)
\ No newline at end of file
+
+    def delete_key(kid):
+        try:
+            client.delete_project_api_key(project_id, kid)
+            return kid, None
+        except Exception as e:
+            return kid, e
+
+    # Delete the keys
+    ids_to_delete = [key_id for key_id, _, _, _ in deletable]
+    click.echo(f"\nDeleting API key{'s' if len(ids_to_delete) > 1 else ''} {', '.join(ids_to_delete)}...")
+
+    if parallel > 1 and len(ids_to_delete) > 1:
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=min(parallel, len(ids_to_delete))) as executor:
+            outcomes = list(executor.map(delete_key, ids_to_delete))
+    else:
+        outcomes = [delete_key(kid) for kid in ids_to_delete]
+
+    failed = [(kid, error) for kid, error in outcomes if error is not None]
+    for kid, error in failed:
+        click.echo(f"\n[ERROR] Error deleting key {kid}: {error}", err=True)
+
+    if failed:
+        sys.exit(1)
+
+    click.echo(f"\n[SUCCESS] API key{'s' if len(ids_to_delete) > 1 else ''} deleted successfully.")
\ No newline at end of file
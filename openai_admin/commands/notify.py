@@ -1,6 +1,7 @@
 """Notification testing and management commands"""
 import click
 import json
+from operator import itemgetter
 from openai_admin.notifier import NotificationManager
 
 
@@ -10,6 +11,15 @@ def notify():
     pass
 
 
+def _get_notifier(ctx):
+    """Build the NotificationManager once per CLI process and reuse it"""
+    notifier = ctx.obj.get('_notifier')
+    if notifier is None:
+        notifier = NotificationManager()
+        ctx.obj['_notifier'] = notifier
+    return notifier
+
+
 @notify.command('test')
 @click.argument('user_id')
 @click.option('--channel', type=click.Choice(['mattermost', 'email']), default='mattermost', help='Notification channel')
@@ -18,7 +28,7 @@ def notify():
 def test_notification(ctx, user_id, channel, message):
     """Test sending a notification to a user"""
     try:
-        notifier = NotificationManager()
+        notifier = _get_notifier(ctx)
         
         if not notifier.is_available(channel):
             click.echo(f"[ERROR] Notification channel '{channel}' is not available or not configured", err=True)
@@ -49,7 +59,7 @@ def test_notification(ctx, user_id, channel, message):
 def list_users(ctx, channel):
     """List available users for notifications"""
     try:
-        notifier = NotificationManager()
+        notifier = _get_notifier(ctx)
         
         channels_to_check = [channel] if channel else notifier.get_available_channels()
         
@@ -71,7 +81,15 @@ def list_users(ctx, channel):
             
             click.echo(f"\n[INFO] Available users for {ch} notifications:\n")
             
-            for user_id, user_info in sorted(users.items(), key=lambda x: int(x[0])):
+            # Precompute numeric sort keys once instead of int() per comparison
+            try:
+                decorated = [(int(uid), uid, info) for uid, info in users.items()]
+                decorated.sort(key=itemgetter(0))
+                ordered_users = [(uid, info) for _, uid, info in decorated]
+            except ValueError:
+                ordered_users = sorted(users.items())
+
+            for user_id, user_info in ordered_users:
                 click.echo(f"  User ID: {user_id}")
                 click.echo(f"    Name:  {user_info.get('name', 'N/A')}")
                 click.echo(f"    Email: {user_info.get('email', 'N/A')}")
@@ -91,7 +109,7 @@ def list_users(ctx, channel):
 def notification_status(ctx):
     """Show notification system status"""
     try:
-        notifier = NotificationManager()
+        notifier = _get_notifier(ctx)
         
         available_channels = notifier.get_available_channels()
         
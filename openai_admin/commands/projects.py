@@ -3,10 +3,31 @@ import click
 import json
 import sys
 import os # Added for file operations
-from datetime import datetime, timedelta
-from tabulate import tabulate
 from openai_admin.utils import format_timestamp, format_redacted_value, with_notification, notification_options
-import requests
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Section separators and indentation levels (Level 1: 3 spaces, Level 2:
+# 6 spaces), built once at import time instead of per command invocation
+SEP_MAJOR = '=' * 80
+SEP_MINOR = '─' * 80
+INDENT_1 = ' ' * 3
+INDENT_2 = ' ' * 6
+
+# Rate-limit fields copied into exported templates; one C-level dict comp
+# per row instead of seven literal .get calls
+_RL_KEYS = (
+    'model',
+    'max_requests_per_1_minute',
+    'max_tokens_per_1_minute',
+    'max_images_per_1_minute',
+    'max_audio_megabytes_per_1_minute',
+    'max_requests_per_1_day',
+    'batch_1_day_max_input_tokens',
+)
 
 # Assuming logger is defined elsewhere in the module or passed in context.
 # Since it's not explicitly passed, for the sake of making the snippet runnable,
@@ -36,6 +57,48 @@ def projects():
     pass
 
 
+def _parse_http_error(e):
+    """Decode an HTTPError body once, returning (error_code, error_message)
+
+    The error paths used to read .text and then .json(), decoding the body
+    twice; this parses the raw bytes a single time and falls back to the
+    decoded text when the body is not the API's error JSON.
+    """
+    resp = getattr(e, 'response', None)
+    if resp is None:
+        return None, str(e)
+    body = resp.content or b''
+    try:
+        data = orjson.loads(body) if orjson is not None else json.loads(body)
+        err = data.get('error', {})
+        return err.get('code', ''), err.get('message') or body.decode('utf-8', 'replace')
+    except Exception:
+        return None, body.decode('utf-8', 'replace')
+
+
+def _get_org_user_index(ctx, client):
+    """Build the org-wide email -> user id lookup, cached on ctx.obj
+
+    Pages through the full user list so organizations with more than one
+    page of users do not produce bogus "not found in organization"
+    warnings, and repeated lookups within one invocation cost nothing.
+    """
+    org_users = ctx.obj.get('_org_users')
+    if org_users is None:
+        org_users = {}
+        after = None
+        while True:
+            page = client.list_users(limit=100, after=after)
+            data = page.get('data', [])
+            for user in data:
+                org_users[user.get('email')] = user.get('id')
+            if not data or not page.get('has_more'):
+                break
+            after = data[-1].get('id')
+        ctx.obj['_org_users'] = org_users
+    return org_users
+
+
 @projects.command('list')
 @click.option('--include-archived', is_flag=True, help='Include archived projects')
 @click.option('--limit', default=100, help='Maximum number of projects to return')
@@ -45,7 +108,7 @@ def projects():
 @with_notification
 def list_projects(ctx, include_archived, limit, output_format):
     """List all projects in the organization"""
-    client = ctx.obj['client']
+    client = ctx.obj['client_factory']()
     
     # Apply Progress Message Style
     click.echo("Fetching projects...")
@@ -59,30 +122,39 @@ def list_projects(ctx, include_archived, limit, output_format):
         return
     
     if output_format == 'json':
-        import json
-        # Apply JSON Output Style
-        click.echo(json.dumps(result, indent=2))
+        # Apply JSON Output Style (orjson pretty-prints large listings much
+        # faster than stdlib json when it is installed)
+        if orjson is not None:
+            click.echo(orjson.dumps(result, option=orjson.OPT_INDENT_2).decode())
+        else:
+            click.echo(json.dumps(result, indent=2))
     else:
-        # Table format
-        table_data = []
-        for project in projects_data:
-            # Use 'N/A' for missing/null values and consistent timestamp formatting
-            table_data.append([
-                project.get('id', 'N/A'),
-                project.get('name', 'N/A'),
-                project.get('status', 'N/A'),
-                format_timestamp(project.get('created_at')),
-                format_timestamp(project.get('archived_at')) if project.get('archived_at') else 'N/A'
-            ])
-        
+        # Deferred import: only the table branch pays for tabulate
+        from tabulate import tabulate
+
+        # Table format; one dict lookup per field, built in a single pass
+        def _rows(projects_data):
+            for project in projects_data:
+                get = project.get
+                # Use 'N/A' for missing/null values and consistent timestamp formatting
+                archived_at = get('archived_at')
+                yield (
+                    get('id', 'N/A'),
+                    get('name', 'N/A'),
+                    get('status', 'N/A'),
+                    format_timestamp(get('created_at')),
+                    format_timestamp(archived_at) if archived_at else 'N/A'
+                )
+
         # Apply Table Header Style (Title Case)
         headers = ['ID', 'Name', 'Status', 'Created At', 'Archived At']
         
         # Apply Summary Lines Style
         click.echo(f"\nTotal projects: {len(projects_data)}\n")
         
-        # Apply Table Output Style (grid format)
-        click.echo(tabulate(table_data, headers=headers, tablefmt='grid'))
+        # Apply Table Output Style (grid format; tabulate needs a sequence,
+        # so the generator is materialized once at the call site)
+        click.echo(tabulate(list(_rows(projects_data)), headers=headers, tablefmt='grid'))
 
 
 @projects.command('create')
@@ -97,9 +169,7 @@ def create_project(ctx, name, output_format):
     Creates a simple project with the given name. For more complex setups
     (users, service accounts, rate limits), use 'create-from-template'.
     """
-    client = ctx.obj['client']
-    
-    indent_1 = ' ' * 3
+    client = ctx.obj['client_factory']()
     
     click.echo(f"Creating project '{name}'...")
     
@@ -109,19 +179,19 @@ def create_project(ctx, name, output_format):
         if output_format == 'json':
             click.echo(json.dumps(result, indent=2))
         else:
-            click.echo(f"\n{'='*80}")
+            click.echo(f"\n{SEP_MAJOR}")
             click.echo(f"[SUCCESS] Project Created Successfully!")
-            click.echo(f"{'='*80}")
+            click.echo(f"{SEP_MAJOR}")
             click.echo(f"ID:         {result.get('id')}")
             click.echo(f"Name:       {result.get('name')}")
             click.echo(f"Status:     {result.get('status')}")
             click.echo(f"Created At: {format_timestamp(result.get('created_at'))}")
-            click.echo(f"{'='*80}\n")
+            click.echo(f"{SEP_MAJOR}\n")
             
             click.echo(f"[TIP] Next steps:")
-            click.echo(f"{indent_1}• Add users: python cli.py projects add-user {result.get('id')} USER_ID ROLE")
-            click.echo(f"{indent_1}• Create service accounts: python cli.py service-accounts create {result.get('id')} NAME")
-            click.echo(f"{indent_1}• Configure rate limits: python cli.py rate-limits list {result.get('id')}\n")
+            click.echo(f"{INDENT_1}• Add users: python cli.py projects add-user {result.get('id')} USER_ID ROLE")
+            click.echo(f"{INDENT_1}• Create service accounts: python cli.py service-accounts create {result.get('id')} NAME")
+            click.echo(f"{INDENT_1}• Configure rate limits: python cli.py rate-limits list {result.get('id')}\n")
     
     except Exception as e:
         click.echo(f"\n[ERROR] Failed to create project: {e}", err=True)
@@ -134,10 +204,8 @@ def create_project(ctx, name, output_format):
 @click.pass_context
 def export_project_template(ctx, project_id, output):
     """Export a project configuration as a reusable template"""
-    client = ctx.obj['client']
-    import json
-    import os
-    
+    client = ctx.obj['client_factory']()
+
     # Apply Progress Message Style
     click.echo(f"Fetching project configuration for {project_id}...")
     
@@ -183,15 +251,7 @@ def export_project_template(ctx, project_id, output):
             for sa in service_accounts
         ],
         "rate_limits": [
-            {
-                "model": rl.get('model'),
-                "max_requests_per_1_minute": rl.get('max_requests_per_1_minute'),
-                "max_tokens_per_1_minute": rl.get('max_tokens_per_1_minute'),
-                "max_images_per_1_minute": rl.get('max_images_per_1_minute'),
-                "max_audio_megabytes_per_1_minute": rl.get('max_audio_megabytes_per_1_minute'),
-                "max_requests_per_1_day": rl.get('max_requests_per_1_day'),
-                "batch_1_day_max_input_tokens": rl.get('batch_1_day_max_input_tokens'),
-            }
+            {key: rl.get(key) for key in _RL_KEYS}
             for rl in rate_limits
         ]
     }
@@ -203,10 +263,28 @@ def export_project_template(ctx, project_id, output):
         safe_name = project.get('name', 'project').replace(' ', '_').replace('/', '_')
         output = os.path.join(templates_dir, f"{safe_name}.json")
     
-    # Write template
+    # Write template: serialize to bytes up front (orjson skips the
+    # intermediate str encode), then emit them through a raw fd so the
+    # whole file goes out in one write instead of json.dump's many small
+    # buffered writes
     try:
-        with open(output, 'w') as f:
-            json.dump(template, f, indent=2)
+        if orjson is not None:
+            data = orjson.dumps(template, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+        else:
+            data = (json.dumps(template, indent=2) + '\n').encode()
+        # Write to a sibling tempfile and rename into place: os.replace is
+        # atomic, so a crash mid-write can never leave a truncated template
+        # at the destination. One fsync at the end instead of per-chunk
+        # flushes.
+        tmp = output + '.tmp'
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            while data:
+                data = data[os.write(fd, data):]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp, output)
     except Exception as e:
         click.echo(f"[ERROR] Failed to write template to {output}: {e}", err=True)
         return
@@ -230,14 +308,16 @@ def export_project_template(ctx, project_id, output):
 @click.pass_context
 def create_from_template(ctx, template_file, dry_run):
     """Create a new project from a template file"""
-    client = ctx.obj['client']
-    import json
-    
+    client = ctx.obj['client_factory']()
+    # Needed for the HTTPError handling below; deferred so commands that
+    # never touch the network don't import it at module load
+    import requests
+
     # Load template (Apply Progress Message Style)
     click.echo(f"Loading template from file...")
     try:
-        with open(template_file, 'r') as f:
-            template = json.load(f)
+        with open(template_file, 'rb') as f:
+            template = orjson.loads(f.read()) if orjson is not None else json.load(f)
     except Exception as e:
         click.echo(f"[ERROR] Failed to load or parse template file {template_file}: {e}", err=True)
         return
@@ -250,23 +330,21 @@ def create_from_template(ctx, template_file, dry_run):
     # Show what will be created (Preview - Apply [CONFIG], [USERS], [SERVICE ACCOUNTS] prefixes and Indentation)
     click.echo(f"\n[CONFIG] Project Configuration:")
     # Apply Indentation (Level 1: 3 spaces)
-    indent_1 = ' ' * 3
-    click.echo(f"{indent_1}Name: {project_name}")
-    click.echo(f"{indent_1}Users: {len(users)}")
-    click.echo(f"{indent_1}Service Accounts: {len(service_accounts)}")
-    click.echo(f"{indent_1}Rate Limits: {len(rate_limits)}")
+    click.echo(f"{INDENT_1}Name: {project_name}")
+    click.echo(f"{INDENT_1}Users: {len(users)}")
+    click.echo(f"{INDENT_1}Service Accounts: {len(service_accounts)}")
+    click.echo(f"{INDENT_1}Rate Limits: {len(rate_limits)}")
     
     if users:
         click.echo(f"\n[USERS] Users to add:")
         # Apply Lists and Bullet Points Style (6-space indentation for bullets, since base is 3)
-        indent_2 = ' ' * 6
         for user in users:
-            click.echo(f"{indent_2}• {user.get('email', 'N/A')} ({user.get('role', 'N/A')})")
+            click.echo(f"{INDENT_2}• {user.get('email', 'N/A')} ({user.get('role', 'N/A')})")
     
     if service_accounts:
         click.echo(f"\n[SERVICE ACCOUNTS] Service Accounts to create:")
         for sa in service_accounts:
-            click.echo(f"{indent_2}• {sa.get('name', 'N/A')} ({sa.get('role', 'N/A')})")
+            click.echo(f"{INDENT_2}• {sa.get('name', 'N/A')} ({sa.get('role', 'N/A')})")
     
     if dry_run:
         click.echo(f"\n[INFO] Dry run complete. No changes were made.")
@@ -287,8 +365,7 @@ def create_from_template(ctx, template_file, dry_run):
         
         # Get all org users for lookup
         click.echo(f"[INFO] Fetching organization users...")
-        org_users_result = client.list_users(limit=100)
-        org_users = {user.get('email'): user.get('id') for user in org_users_result.get('data', [])}
+        org_users = _get_org_user_index(ctx, client)
         
         # Add users
         if users:
@@ -296,31 +373,33 @@ def create_from_template(ctx, template_file, dry_run):
             for user in users:
                 email = user.get('email')
                 role = user.get('role')
-                
-                if email not in org_users:
+
+                # Single dict probe instead of a membership test followed
+                # by a second lookup
+                user_id = org_users.get(email)
+                if user_id is None:
                     # Apply [WARNING] prefix
-                    click.echo(f"{indent_1}[WARNING] Skipping {email} - not found in organization.")
+                    click.echo(f"{INDENT_1}[WARNING] Skipping {email} - not found in organization.")
                     continue
-                
-                user_id = org_users[email]
+
                 try:
                     client.add_project_user(project_id, user_id, role)
                     # Apply [SUCCESS] prefix
-                    click.echo(f"{indent_1}[SUCCESS] Added {email} as {role}")
+                    click.echo(f"{INDENT_1}[SUCCESS] Added {email} as {role}")
                 except requests.exceptions.HTTPError as e:
                     # Check if user already exists (common when user is the project creator)
+                    error_code, error_msg = _parse_http_error(e)
                     if e.response is not None and e.response.status_code == 400:
-                        error_text = str(e.response.text) if hasattr(e.response, 'text') else str(e)
-                        if 'already exists in project' in error_text or 'user_already_in_project' in error_text:
+                        if error_code == 'user_already_in_project' or 'already exists in project' in error_msg:
                             # Apply [INFO] prefix
-                            click.echo(f"{indent_1}[INFO] {email} already in project (auto-added as creator)")
+                            click.echo(f"{INDENT_1}[INFO] {email} already in project (auto-added as creator)")
                         else:
                             # Apply [ERROR] prefix
-                            click.echo(f"{indent_1}[ERROR] Failed to add {email}: {e.response.text if hasattr(e.response, 'text') else e}")
+                            click.echo(f"{INDENT_1}[ERROR] Failed to add {email}: {error_msg}")
                     else:
-                        click.echo(f"{indent_1}[ERROR] Failed to add {email}: {e}")
+                        click.echo(f"{INDENT_1}[ERROR] Failed to add {email}: {e}")
                 except Exception as e:
-                    click.echo(f"{indent_1}[ERROR] Failed to add {email}: {e}")
+                    click.echo(f"{INDENT_1}[ERROR] Failed to add {email}: {e}")
         
         # Create service accounts
         if service_accounts:
@@ -330,32 +409,31 @@ def create_from_template(ctx, template_file, dry_run):
                 try:
                     sa_result = client.create_project_service_account(project_id, name)
                     # Apply [SUCCESS] prefix
-                    click.echo(f"{indent_1}[SUCCESS] Created Service Account: {name}") # Use full terminology
+                    click.echo(f"{INDENT_1}[SUCCESS] Created Service Account: {name}") # Use full terminology
                     
                     # Apply Indentation (Level 2: 6 spaces)
-                    indent_2 = ' ' * 6
-                    click.echo(f"{indent_2}ID: {sa_result.get('id')}")
+                    click.echo(f"{INDENT_2}ID: {sa_result.get('id')}")
                     
                     # Show API key if returned
                     api_key = sa_result.get('api_key', {})
                     if api_key.get('value'):
                         # Apply [LOG] prefix for the key (since it's sensitive)
-                        click.echo(f"{indent_2}[KEY] API Key: {api_key.get('value')}")
+                        click.echo(f"{INDENT_2}[KEY] API Key: {api_key.get('value')}")
                         # Apply [WARNING] prefix
-                        click.echo(f"{indent_2}[WARNING] Save this key - it won't be shown again!")
+                        click.echo(f"{INDENT_2}[WARNING] Save this key - it won't be shown again!")
                 except Exception as e:
-                    click.echo(f"{indent_1}[ERROR] Failed to create Service Account {name}: {e}")
+                    click.echo(f"{INDENT_1}[ERROR] Failed to create Service Account {name}: {e}")
         
         # Note about rate limits
         if rate_limits:
             # Apply [NOTE] prefix
             click.echo(f"\n[NOTE] Rate limit configuration not yet implemented")
-            click.echo(f"{indent_1}You can manually configure rate limits for {project_id}")
+            click.echo(f"{INDENT_1}You can manually configure rate limits for {project_id}")
         
         # Final success message
         click.echo(f"\n[SUCCESS] Project created successfully!")
-        click.echo(f"{indent_1}ID: {project_id}")
-        click.echo(f"{indent_1}Name: {project_name}")
+        click.echo(f"{INDENT_1}ID: {project_id}")
+        click.echo(f"{INDENT_1}Name: {project_name}")
         
     except Exception as e:
         # Apply Detailed Errors with Context Style
@@ -366,10 +444,11 @@ def create_from_template(ctx, template_file, dry_run):
 @projects.command('delete')
 @click.argument('project_ids', nargs=-1, required=True)
 @click.option('--force', is_flag=True, help='Skip confirmation prompts')
+@click.option('--jobs', default=1, help='Number of projects to archive concurrently')
 @click.pass_context
 @notification_options
 @with_notification
-def delete_project(ctx, project_ids, force):
+def delete_project(ctx, project_ids, force, jobs):
     """Delete (archive) one or more projects
     
     Note: Projects are archived, not permanently deleted. The archiving process
@@ -383,12 +462,9 @@ def delete_project(ctx, project_ids, force):
     Archived projects cannot be used or updated but remain visible in the
     organization when using --include-archived flag.
     """
-    client = ctx.obj['client']
-    
-    # Indentation levels
-    indent_1 = ' ' * 3
-    indent_2 = ' ' * 6
-    
+    client = ctx.obj['client_factory']()
+    import requests
+
     logger.info(f"=== Starting project delete operation for: {project_ids} ===")
     click.echo(f"[LOG] Logging details to: {log_file}\n") # Using [LOG] prefix
     
@@ -396,246 +472,309 @@ def delete_project(ctx, project_ids, force):
         click.echo("[ERROR] Please provide at least one project ID to delete", err=True)
         sys.exit(1)
     
-    # Fetch details for all projects
-    projects_info = []
-    for project_id in project_ids:
+    from concurrent.futures import ThreadPoolExecutor
+
+    def fetch_project_info(project_id):
+        """Fetch one project plus its resources, overlapping the list calls"""
+        # get_project runs first and must stay first: an unknown ID raises
+        # here (404) and an archived project returns early, so neither case
+        # pays for the three resource listings below
+        project = client.get_project(project_id)
+
+        # Check if already archived
+        if project.get('status') == 'archived':
+            return {'id': project_id, 'name': project.get('name'), 'archived': True}
+
+        # The three resource listings are independent reads; issue them
+        # concurrently so the wait is one round-trip instead of three
+        with ThreadPoolExecutor(max_workers=3) as resource_pool:
+            users_future = resource_pool.submit(client.list_project_users, project_id)
+            sa_future = resource_pool.submit(client.list_project_service_accounts, project_id)
+            keys_future = resource_pool.submit(client.list_project_api_keys, project_id)
+            users = users_future.result().get('data', [])
+            service_accounts = sa_future.result().get('data', [])
+            api_keys = keys_future.result().get('data', [])
+
+        return {
+            'id': project_id,
+            'name': project.get('name', 'Unnamed Project'),
+            'users': users,
+            'service_accounts': service_accounts,
+            'api_keys': api_keys
+        }
+
+    def fetch_one(project_id):
         try:
-            # Apply Progress Message Style
-            click.echo(f"Processing: Project {project_id}")
-            project = client.get_project(project_id)
-            
-            # Check if already archived
-            if project.get('status') == 'archived':
-                click.echo(f"{indent_1}[WARNING] Project {project_id} ({project.get('name')}) is already archived. Skipping.")
-                continue
-            
-            # Get project resources
-            users_result = client.list_project_users(project_id)
-            users = users_result.get('data', [])
-            
-            sa_result = client.list_project_service_accounts(project_id)
-            service_accounts = sa_result.get('data', [])
-            
-            keys_result = client.list_project_api_keys(project_id)
-            api_keys = keys_result.get('data', [])
-            
-            projects_info.append({
-                'id': project_id,
-                'name': project.get('name', 'Unnamed Project'),
-                'users': users,
-                'service_accounts': service_accounts,
-                'api_keys': api_keys
-            })
+            return fetch_project_info(project_id), None
         except Exception as e:
-            click.echo(f"[ERROR] Error fetching project {project_id}: {e}", err=True)
+            return None, e
+
+    # Fetch details for all projects; overlap across projects when several
+    # IDs were given
+    for project_id in project_ids:
+        # Apply Progress Message Style
+        click.echo(f"Processing: Project {project_id}")
+
+    if len(project_ids) > 1:
+        with ThreadPoolExecutor(max_workers=min(8, len(project_ids))) as pool:
+            fetched = list(pool.map(fetch_one, project_ids))
+    else:
+        fetched = [fetch_one(project_ids[0])]
+
+    projects_info = []
+    for project_id, (info, error) in zip(project_ids, fetched):
+        if error is not None:
+            click.echo(f"[ERROR] Error fetching project {project_id}: {error}", err=True)
+            continue
+        if info.get('archived'):
+            click.echo(f"{INDENT_1}[WARNING] Project {project_id} ({info['name']}) is already archived. Skipping.")
             continue
+        projects_info.append(info)
     
     if not projects_info:
         click.echo("No active projects found to delete.")
         return
     
-    # Show summary (Preview)
+    # Show summary (Preview); buffered and emitted with a single write
+    # instead of one click.echo per line
+    out = []
+    emit = out.append
+
     # Apply Major Section Header Style (80-character width)
-    click.echo(f"\n{'='*80}")
-    click.echo(f"Projects to Delete (Archive)") # Removed [DELETE] prefix for section header
-    click.echo(f"{'='*80}\n")
-    
+    emit(f"\n{SEP_MAJOR}")
+    emit("Projects to Delete (Archive)") # Removed [DELETE] prefix for section header
+    emit(f"{SEP_MAJOR}\n")
+
     for info in projects_info:
         user_count = len(info['users'])
         sa_count = len(info['service_accounts'])
         key_count = len(info['api_keys'])
-        
+
         # Apply Indentation for Hierarchical Information
-        click.echo(f"[PROJECT] {info['name']} ({info['id']})")
-        
+        emit(f"[PROJECT] {info['name']} ({info['id']})")
+
         # Users
         if user_count > 0:
-            click.echo(f"{indent_1}[USERS] {user_count} user(s) will be removed:")
+            emit(f"{INDENT_1}[USERS] {user_count} user(s) will be removed:")
             for user in info['users']:
-                click.echo(f"{indent_2}• {user.get('name', 'N/A')} ({user.get('email', 'N/A')}) - {user.get('role', 'N/A')}") # Apply bullet list style
+                emit(f"{INDENT_2}• {user.get('name', 'N/A')} ({user.get('email', 'N/A')}) - {user.get('role', 'N/A')}") # Apply bullet list style
         else:
-            click.echo(f"{indent_1}[USERS] No users")
-        
+            emit(f"{INDENT_1}[USERS] No users")
+
         # Service Accounts
         if sa_count > 0:
-            click.echo(f"{indent_1}[SERVICE ACCOUNTS] {sa_count} Service Account(s) will be removed:")
+            emit(f"{INDENT_1}[SERVICE ACCOUNTS] {sa_count} Service Account(s) will be removed:")
             for sa in info['service_accounts']:
-                click.echo(f"{indent_2}• {sa.get('name', 'Unnamed')} ({sa.get('id')})") # Apply bullet list style
+                emit(f"{INDENT_2}• {sa.get('name', 'Unnamed')} ({sa.get('id')})") # Apply bullet list style
         else:
-            click.echo(f"{indent_1}[SERVICE ACCOUNTS] No Service Accounts")
-        
+            emit(f"{INDENT_1}[SERVICE ACCOUNTS] No Service Accounts")
+
         # API Keys
         if key_count > 0:
-            click.echo(f"{indent_1}[API KEYS] {key_count} API Key(s) will be automatically deleted:")
+            emit(f"{INDENT_1}[API KEYS] {key_count} API Key(s) will be automatically deleted:")
             for key in info['api_keys']:
-                click.echo(f"{indent_2}• {key.get('name', 'Unnamed')} - {format_redacted_value(key.get('redacted_value', 'N/A'))}") # Apply bullet list style
+                emit(f"{INDENT_2}• {key.get('name', 'Unnamed')} - {format_redacted_value(key.get('redacted_value', 'N/A'))}") # Apply bullet list style
         else:
-            click.echo(f"{indent_1}[API KEYS] No API Keys")
-        
-        click.echo()
+            emit(f"{INDENT_1}[API KEYS] No API Keys")
+
+        emit("")
+
+    click.echo("\n".join(out))
     
     # Confirmation (Apply Confirmation Prompts Style)
     if not force:
         click.echo("\n[WARNING] This will archive the project(s). Users and Service Accounts will") # Use full terminology
-        click.echo(f"{indent_1}be removed, and API keys will be automatically deleted. Archived projects")
-        click.echo(f"{indent_1}cannot be used. Organization owners cannot be removed from projects.")
+        click.echo(f"{INDENT_1}be removed, and API keys will be automatically deleted. Archived projects")
+        click.echo(f"{INDENT_1}cannot be used. Organization owners cannot be removed from projects.")
         if not click.confirm(f'\nDo you want to archive {len(projects_info)} project(s)?'):
             click.echo("Cancelled.")
             return
     
-    # Process each project (Multi-Step Operations Style)
-    for info in projects_info:
+    # Process each project (Multi-Step Operations Style). The body is a
+    # function so multiple projects can be archived concurrently with
+    # --jobs; each run buffers its own lines and they are flushed in
+    # submission order, keeping the output deterministic either way.
+    def process_one(info):
+        lines = []
+        echo = lines.append
         project_id = info['id']
         project_name = info['name']
         users = info['users']
         service_accounts = info['service_accounts']
         api_keys = info['api_keys']
-        
+
         # Apply Minor Separator and Progress Message Style
-        click.echo(f"\n{'─'*80}")
-        click.echo(f"Processing: {project_name} ({project_id})")
-        click.echo(f"{'─'*80}")
+        echo(f"\n{SEP_MINOR}")
+        echo(f"Processing: {project_name} ({project_id})")
+        echo(f"{SEP_MINOR}")
         
         # API Key Note (No action, just INFO)
         if api_keys:
-            click.echo(f"[API KEYS] {len(api_keys)} API key(s) will be automatically deleted when project is archived.")
+            echo(f"[API KEYS] {len(api_keys)} API key(s) will be automatically deleted when project is archived.")
             logger.info(f"Skipping manual deletion of {len(api_keys)} API keys - will be auto-deleted on archive")
         
-        # Step 1: Remove service accounts
+        # Step 1: Remove service accounts (deletions are independent, so
+        # they run concurrently; results are reported in input order)
         if service_accounts:
-            click.echo(f"[SERVICE ACCOUNTS] Removing {len(service_accounts)} Service Account(s)...")
+            echo(f"[SERVICE ACCOUNTS] Removing {len(service_accounts)} Service Account(s)...")
             logger.info(f"Removing {len(service_accounts)} service accounts from project {project_id}")
-            for sa in service_accounts:
-                sa_id = sa.get('id')
-                sa_name = sa.get('name', 'Unnamed')
-                logger.info(f"Attempting to remove service account: {sa_name} ({sa_id})")
+
+            def remove_sa(sa):
+                logger.info(f"Attempting to remove service account: {sa.get('name', 'Unnamed')} ({sa.get('id')})")
                 try:
-                    client.delete_project_service_account(project_id, sa_id)
-                    click.echo(f"{indent_1}[SUCCESS] Removed Service Account: {sa_name}")
+                    client.delete_project_service_account(project_id, sa.get('id'))
+                    return sa, None
+                except Exception as e:
+                    return sa, e
+
+            if len(service_accounts) > 1:
+                with ThreadPoolExecutor(max_workers=min(16, len(service_accounts))) as pool:
+                    sa_outcomes = list(pool.map(remove_sa, service_accounts))
+            else:
+                sa_outcomes = [remove_sa(service_accounts[0])]
+
+            for sa, error in sa_outcomes:
+                sa_name = sa.get('name', 'Unnamed')
+                if error is None:
+                    echo(f"{INDENT_1}[SUCCESS] Removed Service Account: {sa_name}")
                     logger.info(f"Successfully removed service account: {sa_name}")
-                except requests.exceptions.HTTPError as e:
-                    logger.error(f"Failed to remove service account {sa_name}: {e}")
-                    error_msg = str(e)
-                    if e.response:
-                        logger.error(f"Status: {e.response.status_code}, Body: {e.response.text}")
-                        try:
-                            error_data = e.response.json()
-                            error_msg = error_data.get('error', {}).get('message', e.response.text)
-                        except:
-                            error_msg = e.response.text
-                    
-                    if e.response and e.response.status_code == 404:
-                        click.echo(f"{indent_1}[INFO] Service Account {sa_name} not found (may already be removed).")
+                elif isinstance(error, requests.exceptions.HTTPError):
+                    logger.error(f"Failed to remove service account {sa_name}: {error}")
+                    _, error_msg = _parse_http_error(error)
+                    if error.response:
+                        logger.error(f"Status: {error.response.status_code}, Body: {error_msg}")
+
+                    if error.response and error.response.status_code == 404:
+                        echo(f"{INDENT_1}[INFO] Service Account {sa_name} not found (may already be removed).")
                     else:
-                        click.echo(f"{indent_1}[ERROR] Failed to remove Service Account {sa_name}: {error_msg}")
-                except Exception as e:
-                    logger.exception(f"Unexpected error removing service account {sa_name}")
-                    click.echo(f"{indent_1}[ERROR] Failed to remove Service Account {sa_name}: {e}")
+                        echo(f"{INDENT_1}[ERROR] Failed to remove Service Account {sa_name}: {error_msg}")
+                else:
+                    logger.error(f"Unexpected error removing service account {sa_name}: {error}")
+                    echo(f"{INDENT_1}[ERROR] Failed to remove Service Account {sa_name}: {error}")
         
-        # Step 2: Remove users (except organization owners)
+        # Step 2: Remove users (except organization owners), mirroring the
+        # concurrent pattern used for service accounts
         if users:
-            click.echo(f"[USERS] Removing {len(users)} user(s)...")
+            echo(f"[USERS] Removing {len(users)} user(s)...")
             logger.info(f"Removing {len(users)} users from project {project_id}")
-            for user in users:
-                user_id = user.get('id')
+
+            def remove_user(user):
+                logger.info(f"Attempting to remove user: {user.get('name', 'N/A')} ({user.get('email', 'N/A')}, {user.get('id')})")
+                try:
+                    client.delete_project_user(project_id, user.get('id'))
+                    return user, None
+                except Exception as e:
+                    return user, e
+
+            if len(users) > 1:
+                with ThreadPoolExecutor(max_workers=min(16, len(users))) as pool:
+                    user_outcomes = list(pool.map(remove_user, users))
+            else:
+                user_outcomes = [remove_user(users[0])]
+
+            for user, error in user_outcomes:
                 user_name = user.get('name', 'N/A')
                 user_email = user.get('email', 'N/A')
-                logger.info(f"Attempting to remove user: {user_name} ({user_email}, {user_id})")
-                try:
-                    client.delete_project_user(project_id, user_id)
-                    click.echo(f"{indent_1}[SUCCESS] Removed user: {user_name} ({user_email})")
+                if error is None:
+                    echo(f"{INDENT_1}[SUCCESS] Removed user: {user_name} ({user_email})")
                     logger.info(f"Successfully removed user: {user_email}")
-                except requests.exceptions.HTTPError as e:
-                    logger.error(f"Failed to remove user {user_email}: {e}")
-                    error_msg = str(e)
-                    error_code = None
-                    if e.response:
-                        logger.error(f"Status: {e.response.status_code}, Body: {e.response.text}")
-                        try:
-                            error_data = e.response.json()
-                            error_code = error_data.get('error', {}).get('code', '')
-                            error_msg = error_data.get('error', {}).get('message', e.response.text)
-                        except:
-                            error_msg = e.response.text
-                        
-                        if e.response.status_code == 404:
-                            click.echo(f"{indent_1}[INFO] User {user_email} not found (may already be removed).")
+                elif isinstance(error, requests.exceptions.HTTPError):
+                    logger.error(f"Failed to remove user {user_email}: {error}")
+                    error_code, error_msg = _parse_http_error(error)
+                    if error.response:
+                        logger.error(f"Status: {error.response.status_code}, Body: {error_msg}")
+
+                        if error.response.status_code == 404:
+                            echo(f"{INDENT_1}[INFO] User {user_email} not found (may already be removed).")
                         elif error_code == 'user_organization_owner':
-                            click.echo(f"{indent_1}[INFO] User {user_email} is an Organization owner (cannot be removed).")
+                            echo(f"{INDENT_1}[INFO] User {user_email} is an Organization owner (cannot be removed).")
                             logger.info(f"User {user_email} is org owner - skipping removal")
                         else:
-                            click.echo(f"{indent_1}[ERROR] Failed to remove user {user_email}: {error_msg}")
+                            echo(f"{INDENT_1}[ERROR] Failed to remove user {user_email}: {error_msg}")
                     else:
-                        click.echo(f"{indent_1}[ERROR] Failed to remove user {user_email}: {str(e)}")
-                except Exception as e:
-                    logger.exception(f"Unexpected error removing user {user_email}")
-                    click.echo(f"{indent_1}[ERROR] Failed to remove user {user_email}: {e}")
+                        echo(f"{INDENT_1}[ERROR] Failed to remove user {user_email}: {str(error)}")
+                else:
+                    logger.error(f"Unexpected error removing user {user_email}: {error}")
+                    echo(f"{INDENT_1}[ERROR] Failed to remove user {user_email}: {error}")
         
         # Step 3: Archive the project
         try:
-            click.echo(f"[PROJECT] Archiving project...")
+            echo(f"[PROJECT] Archiving project...")
             logger.info(f"Attempting to archive project {project_id}")
             result = client.archive_project(project_id)
             logger.info(f"Archive result: {result}")
+            # Remember the returned status so the final verification does
+            # not need a second get_project round trip
+            info['final_status'] = result.get('status')
             if result.get('status') == 'archived':
-                click.echo(f"{indent_1}[SUCCESS] Project archived successfully")
-                click.echo(f"{indent_1}Archived At: {format_timestamp(result.get('archived_at'))}")
+                echo(f"{INDENT_1}[SUCCESS] Project archived successfully")
+                echo(f"{INDENT_1}Archived At: {format_timestamp(result.get('archived_at'))}")
                 logger.info(f"Project {project_id} archived successfully")
             else:
-                click.echo(f"{indent_1}[WARNING] Project status: {result.get('status')}")
+                echo(f"{INDENT_1}[WARNING] Project status: {result.get('status')}")
                 logger.warning(f"Unexpected project status: {result.get('status')}")
         except requests.exceptions.HTTPError as e:
             logger.error(f"Failed to archive project {project_id}: {e}")
-            error_msg = str(e)
-            error_code = None
+            error_code, error_msg = _parse_http_error(e)
             if e.response:
-                logger.error(f"Status: {e.response.status_code}, Body: {e.response.text}")
-                try:
-                    error_data = e.response.json()
-                    error_code = error_data.get('error', {}).get('code', '')
-                    error_msg = error_data.get('error', {}).get('message', '')
-                except:
-                    error_msg = e.response.text
-                
+                logger.error(f"Status: {e.response.status_code}, Body: {error_msg}")
+
                 if error_code == 'project_archived':
-                    click.echo(f"{indent_1}[INFO] Project is already archived.")
+                    echo(f"{INDENT_1}[INFO] Project is already archived.")
                     logger.info("Project was already archived")
+                    info['final_status'] = 'archived'
                 else:
-                    click.echo(f"{indent_1}[ERROR] Failed to archive project: {error_msg or str(e)}")
+                    echo(f"{INDENT_1}[ERROR] Failed to archive project: {error_msg or str(e)}")
                     
                     # Verification check inside the error handler is kept but styled
                     try:
                         logger.info("Verifying project status after error...")
                         verify = client.get_project(project_id)
+                        info['final_status'] = verify.get('status')
                         if verify.get('status') == 'archived':
-                            click.echo(f"{indent_1}[NOTE] Note: Project was archived despite error message.")
+                            echo(f"{INDENT_1}[NOTE] Note: Project was archived despite error message.")
                     except Exception as verify_error:
                         logger.error(f"Failed to verify project status: {verify_error}")
             else:
-                click.echo(f"{indent_1}[ERROR] Failed to archive project: {str(e)}")
+                echo(f"{INDENT_1}[ERROR] Failed to archive project: {str(e)}")
         except Exception as e:
             logger.exception(f"Unexpected error archiving project {project_id}")
-            click.echo(f"{indent_1}[ERROR] Failed to archive project: {e}")
+            echo(f"{INDENT_1}[ERROR] Failed to archive project: {e}")
     
+
+        return lines
+
+    if jobs > 1 and len(projects_info) > 1:
+        with ThreadPoolExecutor(max_workers=min(jobs, len(projects_info))) as pool:
+            for lines in pool.map(process_one, projects_info):
+                click.echo("\n".join(lines))
+    else:
+        for info in projects_info:
+            click.echo("\n".join(process_one(info)))
+
     # Final Success Message
-    click.echo(f"\n{'='*80}")
+    click.echo(f"\n{SEP_MAJOR}")
     click.echo(f"[SUCCESS] Completed")
-    click.echo(f"{'='*80}\n")
+    click.echo(f"{SEP_MAJOR}\n")
     
     click.echo(f"[TIP] Use 'projects list --include-archived' to view archived projects")
     
-    # Final verification
+    # Final verification; buffered like the preview above
     logger.info("=== Performing final verification ===")
-    click.echo(f"\n[INFO] Verifying final status...")
+    verify_out = [f"\n[INFO] Verifying final status..."]
     for info in projects_info:
         try:
-            final_status = client.get_project(info['id'])
-            status = final_status.get('status')
+            # archive_project already reported the status; only re-fetch
+            # when the archive path left it unknown (e.g. an error path)
+            status = info.get('final_status')
+            if status is None:
+                status = client.get_project(info['id']).get('status')
             if status == 'archived':
-                click.echo(f"{indent_1}[SUCCESS] {info['name']}: Successfully archived")
+                verify_out.append(f"{INDENT_1}[SUCCESS] {info['name']}: Successfully archived")
             else:
-                click.echo(f"{indent_1}[WARNING] {info['name']}: Status is '{status}'")
+                verify_out.append(f"{INDENT_1}[WARNING] {info['name']}: Status is '{status}'")
             logger.info(f"Final status for {info['id']}: {status}")
         except Exception as e:
             logger.error(f"Failed to verify {info['id']}: {e}")
-            click.echo(f"{indent_1}[ERROR] {info['name']}: Could not verify status")
\ No newline at end of file
+            verify_out.append(f"{INDENT_1}[ERROR] {info['name']}: Could not verify status")
+    click.echo("\n".join(verify_out))
\ No newline at end of file
@@ -1,11 +1,23 @@
 """Rate Limits commands"""
 import click
-import json
 import sys
-from datetime import datetime, timedelta
-from tabulate import tabulate
-from openai_admin.utils import format_timestamp, format_redacted_value, with_notification, notification_options
-import requests
+from openai_admin.utils import format_timestamp, format_redacted_value, format_table, with_notification, notification_options
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Rate-limit fields with their compact (table) and detail (update) labels;
+# one spec drives both row building and the update success printout
+_LIMIT_FIELDS = (
+    ('max_requests_per_1_minute', 'Req/min', 'Max Requests/min'),
+    ('max_tokens_per_1_minute', 'Tokens/min', 'Max Tokens/min'),
+    ('max_images_per_1_minute', 'Img/min', 'Max Images/min'),
+    ('max_audio_megabytes_per_1_minute', 'Audio MB/min', 'Max Audio MB/min'),
+    ('max_requests_per_1_day', 'Req/day', 'Max Requests/day'),
+    ('batch_1_day_max_input_tokens', 'Batch tokens/day', 'Max Batch tokens/day'),
+)
 
 @click.group(name='rate-limits')
 def rate_limits():
@@ -17,47 +29,53 @@ def rate_limits():
 @click.argument('project_id')
 @click.option('--limit', default=100, help='Maximum number of rate limits to return')
 @click.option('--format', 'output_format', type=click.Choice(['table', 'json']), default='table', help='Output format')
+@click.option('--classic-table', is_flag=True, help='Render tables with tabulate instead of the fast built-in formatter')
 @click.pass_context
 @notification_options
 @with_notification
-def list_rate_limits(ctx, project_id, limit, output_format):
+def list_rate_limits(ctx, project_id, limit, output_format, classic_table):
     """List all rate limits for a project"""
-    client = ctx.obj['client']
+    client = ctx.obj['client_factory']()
     
     # Apply Progress Message Style
     click.echo(f"Fetching rate limits for project {project_id}...")
-    result = client.list_project_rate_limits(project_id, limit=limit)
-    
-    limits_data = result.get('data', [])
-    
+
+    # Follow pagination cursors server-side; islice stops fetching as soon
+    # as --limit rows have been collected, so a small cap never pulls
+    # later pages and a large one no longer silently truncates
+    from itertools import islice
+    limits_data = list(islice(client.iter_project_rate_limits(project_id), limit))
+
     if not limits_data:
         # Apply Empty Results Style
         click.echo("No rate limits found for this project.")
         return
     
     if output_format == 'json':
-        import json
-        # Apply JSON Output Style
-        click.echo(json.dumps(result, indent=2))
+        result = {'object': 'list', 'data': limits_data}
+        # Apply JSON Output Style (orjson serializes several times faster
+        # than stdlib json when it is installed; click.echo keeps the
+        # output capturable by --notify)
+        if orjson is not None:
+            click.echo(orjson.dumps(result, option=orjson.OPT_INDENT_2).decode())
+        else:
+            # Streamed: json.dump writes incrementally instead of
+            # materializing the whole pretty-printed string first
+            import json
+            json.dump(result, sys.stdout, indent=2)
+            sys.stdout.write("\n")
     else:
         # Table format
         table_data = []
         for rl in limits_data:
-            # Build a compact display of limits with thousand separators
-            limits_str = []
-            if rl.get('max_requests_per_1_minute'):
-                limits_str.append(f"Req/min: {rl.get('max_requests_per_1_minute'):,}")
-            if rl.get('max_tokens_per_1_minute'):
-                limits_str.append(f"Tokens/min: {rl.get('max_tokens_per_1_minute'):,}")
-            if rl.get('max_images_per_1_minute'):
-                limits_str.append(f"Img/min: {rl.get('max_images_per_1_minute'):,}")
-            if rl.get('max_audio_megabytes_per_1_minute'):
-                limits_str.append(f"Audio MB/min: {rl.get('max_audio_megabytes_per_1_minute'):,}")
-            if rl.get('max_requests_per_1_day'):
-                limits_str.append(f"Req/day: {rl.get('max_requests_per_1_day'):,}")
-            if rl.get('batch_1_day_max_input_tokens'):
-                limits_str.append(f"Batch tokens/day: {rl.get('batch_1_day_max_input_tokens'):,}")
-            
+            # Build a compact display of limits with thousand separators;
+            # the walrus fuses the get + truthiness test + format per field
+            limits_str = [
+                f"{label}: {value:,}"
+                for key, label, _ in _LIMIT_FIELDS
+                if (value := rl.get(key))
+            ]
+
             table_data.append([
                 rl.get('id', 'N/A'),
                 rl.get('model', 'N/A'),
@@ -71,7 +89,11 @@ def list_rate_limits(ctx, project_id, limit, output_format):
         click.echo(f"\nTotal rate limits: {len(limits_data)}\n")
         
         # Apply Table Output Style (grid format)
-        click.echo(tabulate(table_data, headers=headers, tablefmt='grid'))
+        if classic_table:
+            from tabulate import tabulate
+            click.echo(tabulate(table_data, headers=headers, tablefmt='grid'))
+        else:
+            click.echo(format_table(table_data, headers))
 
 
 @rate_limits.command('update')
@@ -83,17 +105,18 @@ def list_rate_limits(ctx, project_id, limit, output_format):
 @click.option('--max-audio-mb-per-minute', type=int, help='Maximum audio megabytes per minute')
 @click.option('--max-requests-per-day', type=int, help='Maximum requests per day')
 @click.option('--batch-max-tokens-per-day', type=int, help='Maximum batch input tokens per day')
+@click.option('--yes', '-y', is_flag=True, help='Skip confirmation prompt')
 @click.pass_context
 @notification_options
 @with_notification
-def update_rate_limit(ctx, project_id, rate_limit_id, max_requests_per_minute, 
+def update_rate_limit(ctx, project_id, rate_limit_id, max_requests_per_minute,
                      max_tokens_per_minute, max_images_per_minute, max_audio_mb_per_minute,
-                     max_requests_per_day, batch_max_tokens_per_day):
+                     max_requests_per_day, batch_max_tokens_per_day, yes):
     """Update rate limit settings for a model
     
     Only provide the limits you want to change. Omitted limits will remain unchanged.
     """
-    client = ctx.obj['client']
+    client = ctx.obj['client_factory']()
     
     # Indentation level for lists
     indent_1 = ' ' * 3
@@ -117,58 +140,172 @@ def update_rate_limit(ctx, project_id, rate_limit_id, max_requests_per_minute,
         click.echo("[ERROR] No updates specified. Use --help to see available options.", err=True)
         sys.exit(1)
     
-    # Show proposed changes (Preview)
-    # Apply Progress Message Style
-    click.echo(f"Fetching current rate limit settings for {rate_limit_id}...")
-    try:
-        current_rl = client.get_project_rate_limit(project_id, rate_limit_id)
-        model_name = current_rl.get('model', 'N/A')
-    except Exception as e:
-        click.echo(f"[ERROR] Failed to fetch rate limit {rate_limit_id}: {e}", err=True)
-        sys.exit(1)
+    # Show proposed changes (Preview). The preflight lookup only feeds the
+    # model name into the confirmation prompt, so --yes skips it entirely -
+    # one fewer round trip per scripted update.
+    if yes:
+        preview_header = f"\n[INFO] Proposed changes for rate limit {rate_limit_id}:"
+    else:
+        # Apply Progress Message Style
+        click.echo(f"Fetching current rate limit settings for {rate_limit_id}...")
+        try:
+            current_rl = client.get_project_rate_limit(project_id, rate_limit_id)
+            model_name = current_rl.get('model', 'N/A')
+        except Exception as e:
+            click.echo(f"[ERROR] Failed to fetch rate limit {rate_limit_id}: {e}", err=True)
+            sys.exit(1)
 
-    # Apply Update Commands Structure
-    click.echo(f"\n[INFO] Proposed changes for Model '{model_name}' ({rate_limit_id}):")
-    
-    # Apply Lists and Bullet Points Style
-    for key, value in updates.items():
-        # Make the key more readable
-        readable_key = key.replace('_', ' ').replace('1', '').title().strip()
-        # Use thousand separators
-        click.echo(f"{indent_1}• {readable_key}: {value:,}")
+        # Apply Update Commands Structure
+        preview_header = f"\n[INFO] Proposed changes for Model '{model_name}' ({rate_limit_id}):"
+
+    # Apply Lists and Bullet Points Style; labels come precomputed from
+    # the shared field spec (the old replace('1','')/title() dance also
+    # mangled any key legitimately containing a '1'). One joined write
+    # for the whole preview, with thousand separators on the values.
+    preview = [preview_header]
+    preview.extend(
+        f"{indent_1}• {long_label}: {updates[key]:,}"
+        for key, _, long_label in _LIMIT_FIELDS
+        if key in updates
+    )
+    click.echo("\n".join(preview))
     
     # Apply Confirmation Prompts Style
-    click.echo()
-    if not click.confirm('Do you want to apply these changes?'):
-        click.echo("Cancelled.")
-        return
+    if not yes:
+        click.echo()
+        if not click.confirm('Do you want to apply these changes?'):
+            click.echo("Cancelled.")
+            return
     
     # Update the rate limit (Progress Update)
     click.echo(f"\n[INFO] Applying changes...")
     try:
         result = client.update_project_rate_limit(project_id, rate_limit_id, **updates)
         
-        # Apply Success Prefix Style
-        click.echo(f"\n[SUCCESS] Rate limit updated successfully!")
-        
-        # Show updated values
-        click.echo(f"\n[INFO] Updated limits for {result.get('model')}:")
-        
-        # Apply consistent formatting for updated values with labels and thousand separators
-        if result.get('max_requests_per_1_minute') is not None:
-            click.echo(f"{indent_1}Max Requests/min: {result.get('max_requests_per_1_minute'):,}")
-        if result.get('max_tokens_per_1_minute') is not None:
-            click.echo(f"{indent_1}Max Tokens/min:   {result.get('max_tokens_per_1_minute'):,}")
-        if result.get('max_images_per_1_minute') is not None:
-            click.echo(f"{indent_1}Max Images/min:   {result.get('max_images_per_1_minute'):,}")
-        if result.get('max_audio_megabytes_per_1_minute') is not None:
-            click.echo(f"{indent_1}Max Audio MB/min: {result.get('max_audio_megabytes_per_1_minute'):,}")
-        if result.get('max_requests_per_1_day') is not None:
-            click.echo(f"{indent_1}Max Requests/day: {result.get('max_requests_per_1_day'):,}")
-        if result.get('batch_1_day_max_input_tokens') is not None:
-            click.echo(f"{indent_1}Max Batch tokens/day: {result.get('batch_1_day_max_input_tokens'):,}")
+        # Apply Success Prefix Style, then the updated values - formatted
+        # from the shared field spec and emitted as one joined write
+        lines = [
+            "\n[SUCCESS] Rate limit updated successfully!",
+            f"\n[INFO] Updated limits for {result.get('model')}:",
+        ]
+        lines.extend(
+            f"{indent_1}{(long_label + ':').ljust(17)} {value:,}"
+            for key, _, long_label in _LIMIT_FIELDS
+            if (value := result.get(key)) is not None
+        )
+        click.echo("\n".join(lines))
         
     except Exception as e:
         # Apply Detailed Errors with Context Style
         click.echo(f"\n[ERROR] Error updating rate limit {rate_limit_id}: {e}", err=True)
-        sys.exit(1)
\ No newline at end of file
+        sys.exit(1)
+
+@rate_limits.command('bulk-update')
+@click.argument('project_id')
+@click.argument('updates_file', type=click.Path(exists=True))
+@click.option('--yes', '-y', is_flag=True, help='Skip confirmation prompt')
+@click.pass_context
+@notification_options
+@with_notification
+def bulk_update_rate_limits(ctx, project_id, updates_file, yes):
+    """Update several rate limits from a JSON file
+
+    The file holds a list of objects, each with a "rate_limit_id" and any
+    of the fields accepted by 'rate-limits update', e.g.:
+
+        [{"rate_limit_id": "rl-abc", "max_requests_per_1_minute": 500}]
+
+    One listing call resolves all model names up front and the updates are
+    applied concurrently over the client's pooled connections.
+    """
+    client = ctx.obj['client_factory']()
+
+    indent_1 = ' ' * 3
+
+    # Load the updates file (Apply Progress Message Style)
+    click.echo(f"Loading updates from file...")
+    try:
+        with open(updates_file, 'rb') as f:
+            if orjson is not None:
+                entries = orjson.loads(f.read())
+            else:
+                import json
+                entries = json.load(f)
+    except Exception as e:
+        click.echo(f"[ERROR] Failed to load or parse updates file {updates_file}: {e}", err=True)
+        sys.exit(1)
+
+    if not isinstance(entries, list) or not entries:
+        click.echo("[ERROR] Updates file must contain a non-empty JSON list.", err=True)
+        sys.exit(1)
+
+    known_keys = frozenset(key for key, _, _ in _LIMIT_FIELDS)
+    batch = []
+    for entry in entries:
+        rate_limit_id = entry.get('rate_limit_id')
+        updates = {key: value for key, value in entry.items()
+                   if key in known_keys and value is not None}
+        if not rate_limit_id or not updates:
+            click.echo(f"[ERROR] Each entry needs a rate_limit_id and at least one rate-limit field: {entry}", err=True)
+            sys.exit(1)
+        batch.append((rate_limit_id, updates))
+
+    # One listing resolves every model name; no per-id preflight GETs
+    click.echo(f"Fetching current rate limit settings for project {project_id}...")
+    try:
+        listing = client.list_project_rate_limits(project_id)
+        models = {rl.get('id'): rl.get('model', 'N/A') for rl in listing.get('data', [])}
+    except Exception as e:
+        click.echo(f"[ERROR] Failed to fetch rate limits for {project_id}: {e}", err=True)
+        sys.exit(1)
+
+    unknown = [rate_limit_id for rate_limit_id, _ in batch if rate_limit_id not in models]
+    if unknown:
+        click.echo(f"[ERROR] Rate limit(s) not found in project {project_id}: {', '.join(unknown)}", err=True)
+        sys.exit(1)
+
+    # Show proposed changes (Preview)
+    click.echo(f"\n[INFO] Proposed changes for {len(batch)} rate limit(s):")
+    for rate_limit_id, updates in batch:
+        click.echo(f"{indent_1}Model '{models[rate_limit_id]}' ({rate_limit_id}):")
+        for key, _, long_label in _LIMIT_FIELDS:
+            if key in updates:
+                click.echo(f"{indent_1 * 2}• {long_label}: {updates[key]:,}")
+
+    # Apply Confirmation Prompts Style
+    if not yes:
+        click.echo()
+        if not click.confirm(f'Do you want to apply these {len(batch)} change(s)?'):
+            click.echo("Cancelled.")
+            return
+
+    click.echo(f"\n[INFO] Applying changes...")
+
+    def apply_one(item):
+        rate_limit_id, updates = item
+        try:
+            client.update_project_rate_limit(project_id, rate_limit_id, **updates)
+            return rate_limit_id, None
+        except Exception as e:
+            return rate_limit_id, e
+
+    if len(batch) > 1:
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=min(8, len(batch))) as executor:
+            outcomes = list(executor.map(apply_one, batch))
+    else:
+        outcomes = [apply_one(batch[0])]
+
+    failed = 0
+    for rate_limit_id, error in outcomes:
+        if error is None:
+            click.echo(f"{indent_1}[SUCCESS] Updated {models[rate_limit_id]} ({rate_limit_id})")
+        else:
+            failed += 1
+            click.echo(f"{indent_1}[ERROR] Failed to update {rate_limit_id}: {error}", err=True)
+
+    if failed:
+        click.echo(f"\n[ERROR] {failed} of {len(batch)} update(s) failed.", err=True)
+        sys.exit(1)
+
+    click.echo(f"\n[SUCCESS] All {len(batch)} rate limit(s) updated successfully!")
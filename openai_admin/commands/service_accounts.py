@@ -22,7 +22,7 @@ def service_accounts():
 @with_notification
 def list_service_accounts(ctx, project_id, limit, output_format):
     """List all service accounts in a project"""
-    client = ctx.obj['client']
+    client = ctx.obj['client_factory']()
     
     # Apply Progress Message Style
     click.echo(f"Fetching service accounts for project {project_id}...")
@@ -72,7 +72,7 @@ def create_service_account(ctx, project_id, name):
     This will create a service account and generate a new API key.
     The API key value is shown only once - save it immediately!
     """
-    client = ctx.obj['client']
+    client = ctx.obj['client_factory']()
     
     # Apply Progress Message Style
     click.echo(f"Creating Service Account '{name}' in project {project_id}...") # Use full terminology
@@ -128,7 +128,7 @@ def create_service_account(ctx, project_id, name):
 @with_notification
 def get_service_account(ctx, project_id, service_account_id, output_format):
     """Get details of a specific service account"""
-    client = ctx.obj['client']
+    client = ctx.obj['client_factory']()
     
     click.echo(f"Fetching Service Account {service_account_id}...")
     try:
@@ -165,7 +165,7 @@ def delete_service_account(ctx, project_id, service_account_id, force):
     
     Warning: This will also delete all API keys associated with this service account.
     """
-    client = ctx.obj['client']
+    client = ctx.obj['client_factory']()
     
     # Define indentation levels
     indent_1 = ' ' * 3
@@ -28,7 +28,7 @@ def usage():
 @with_notification
 def usage_completions(ctx, start_date, end_date, days, group_by, project_id, model, limit, output_format):
     """Get completions (chat/text) usage statistics"""
-    client = ctx.obj['client']
+    client = ctx.obj['client_factory']()
     
     # Handle date conversion
     from datetime import datetime, timedelta
@@ -176,7 +176,7 @@ def usage_completions(ctx, start_date, end_date, days, group_by, project_id, mod
 @with_notification
 def usage_embeddings(ctx, start_date, end_date, days, group_by, limit, output_format):
     """Get embeddings usage statistics"""
-    client = ctx.obj['client']
+    client = ctx.obj['client_factory']()
     
     from datetime import datetime, timedelta
     
@@ -291,7 +291,7 @@ def usage_embeddings(ctx, start_date, end_date, days, group_by, limit, output_fo
 @with_notification
 def usage_images(ctx, start_date, end_date, days, group_by, limit, output_format):
     """Get image generation usage statistics"""
-    client = ctx.obj['client']
+    client = ctx.obj['client_factory']()
     
     from datetime import datetime, timedelta
     
@@ -402,7 +402,7 @@ def usage_images(ctx, start_date, end_date, days, group_by, limit, output_format
 @with_notification
 def usage_audio_speeches(ctx, start_date, end_date, days, group_by, output_format): # Added end_date to func signature
     """Get audio speeches (TTS) usage statistics"""
-    client = ctx.obj['client']
+    client = ctx.obj['client_factory']()
     
     from datetime import datetime, timedelta
     
@@ -504,7 +504,7 @@ def usage_audio_speeches(ctx, start_date, end_date, days, group_by, output_forma
 @with_notification
 def usage_audio_transcriptions(ctx, start_date, end_date, days, group_by, output_format): # Added end_date to func signature
     """Get audio transcriptions (Whisper) usage statistics"""
-    client = ctx.obj['client']
+    client = ctx.obj['client_factory']()
     
     from datetime import datetime, timedelta
     
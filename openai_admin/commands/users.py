@@ -21,7 +21,7 @@ def users():
 @with_notification
 def list_users(ctx, limit, output_format):
     """List all users in the organization"""
-    client = ctx.obj['client']
+    client = ctx.obj['client_factory']()
     
     # Apply Progress Message Style
     click.echo("Fetching users...")
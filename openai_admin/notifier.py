@@ -8,26 +8,35 @@ from email.mime.multipart import MIMEMultipart
 from typing import Optional, Dict, Any
 from pathlib import Path
 
+# (connect, read) timeout for Mattermost API calls; without it a hung
+# server stalls the whole command indefinitely
+_MATTERMOST_TIMEOUT = (5, 15)
+
 
 class MattermostNotifier:
     """Send notifications via Mattermost"""
-    
+
     def __init__(self):
         """Initialize Mattermost notifier with environment variables"""
         self.bot_token = os.getenv('MATTERMOST_BOT_TOKEN')
         self.bot_id = os.getenv('MATTERMOST_BOT_ID')
         self.base_url = os.getenv('MATTERMOST_BASE_URL', 'https://chat.admin-intelligence.de/api/v4')
-        
+
         if not self.bot_token:
             raise ValueError("MATTERMOST_BOT_TOKEN environment variable is required")
         if not self.bot_id:
             raise ValueError("MATTERMOST_BOT_ID environment variable is required")
-        
+
         self.headers = {
             'Authorization': f'Bearer {self.bot_token}',
             'Content-Type': 'application/json'
         }
-        
+
+        # One session keeps the TLS connection alive across consecutive
+        # posts (e.g. batch rotations notifying several users)
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+
         # Load user mappings
         self.user_mappings = self._load_user_mappings()
     
@@ -60,13 +69,13 @@ class MattermostNotifier:
         Returns:
             API response data
         """
-        response = requests.post(
+        response = self.session.post(
             f"{self.base_url}/posts",
-            headers=self.headers,
             json={
                 'channel_id': channel_id,
                 'message': message
-            }
+            },
+            timeout=_MATTERMOST_TIMEOUT
         )
         response.raise_for_status()
         return response.json()
@@ -102,10 +111,10 @@ class MattermostNotifier:
         Returns:
             Channel ID
         """
-        response = requests.post(
+        response = self.session.post(
             f"{self.base_url}/channels/direct",
-            headers=self.headers,
-            json=[self.bot_id, mattermost_user_id]
+            json=[self.bot_id, mattermost_user_id],
+            timeout=_MATTERMOST_TIMEOUT
         )
         response.raise_for_status()
         return response.json().get('id')
@@ -7,15 +7,28 @@ import io
 import sys
 
 
+@functools.lru_cache(maxsize=8192)
+def _format_timestamp_cached(ts: int) -> str:
+    return datetime.fromtimestamp(ts).strftime("%Y-%m-%d %H:%M:%S")
+
+
 def format_timestamp(ts: Optional[int]) -> str:
-    """Format Unix timestamp to readable date"""
+    """Format Unix timestamp to readable date
+
+    Results are memoized - audit/usage pages often repeat the same
+    second-resolution timestamp many times.
+    """
     if ts is None:
         return "N/A"
-    return datetime.fromtimestamp(ts).strftime("%Y-%m-%d %H:%M:%S")
+    return _format_timestamp_cached(ts)
 
 
+@functools.lru_cache(maxsize=4096)
 def format_redacted_value(value: str) -> str:
-    """Format redacted API key value to be more compact"""
+    """Format redacted API key value to be more compact
+
+    Memoized - redacted values repeat the same patterns across key rows.
+    """
     if not value:
         return "N/A"
     # Replace long strings of asterisks (4 or more) with just 5 stars
@@ -24,6 +37,50 @@ def format_redacted_value(value: str) -> str:
     return shortened
 
 
+def format_table(rows, headers, widths=None) -> str:
+    """Render rows as a fixed-width grid table.
+
+    Lightweight replacement for tabulate's 'grid' format on hot output
+    paths: no Unicode width scanning, no format detection, no import cost.
+    Column widths default to the widest cell in each column; like tabulate,
+    headers get two extra spaces of padding (MIN_PADDING), so a column whose
+    header outgrows its data is widened by two beyond the header itself.
+    Cells are always left-aligned; tabulate's right-alignment of purely
+    numeric columns is not reproduced (no call site emits one).
+    """
+    # Cells may span several lines (e.g. the rate-limits column); split
+    # once up front so width measurement and rendering share the pieces
+    split_rows = [[str(cell).split('\n') for cell in row] for row in rows]
+    headers = [str(header) for header in headers]
+    if widths is None:
+        widths = [
+            max(len(headers[i]) + 2,
+                max((len(line) for row in split_rows for line in row[i]), default=0))
+            for i in range(len(headers))
+        ]
+
+    rule = '+' + '+'.join('-' * (w + 2) for w in widths) + '+'
+    header_rule = '+' + '+'.join('=' * (w + 2) for w in widths) + '+'
+
+    def render_row(cells):
+        height = max(len(cell) for cell in cells)
+        return [
+            '| ' + ' | '.join(
+                (cell[i] if i < len(cell) else '').ljust(w)
+                for cell, w in zip(cells, widths)
+            ) + ' |'
+            for i in range(height)
+        ]
+
+    lines = [rule]
+    lines.extend(render_row([[header] for header in headers]))
+    lines.append(header_rule)
+    for row in split_rows:
+        lines.extend(render_row(row))
+        lines.append(rule)
+    return '\n'.join(lines)
+
+
 def notification_options(func):
     """
     Decorator to add --notify and --channel options to a command.